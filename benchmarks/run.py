@@ -0,0 +1,275 @@
+"""Benchmark suite: generator, candidate search, validation, clues, prototype.
+
+Runs every case on synthetic inputs (see benchmarks/synthetic.py), prints
+one line per case and writes all metrics as JSON. With --baseline, each
+metric is compared against a saved run and the script exits with status 1
+when any metric is worse by more than --threshold.
+"""
+
+import argparse
+import contextlib
+import copy
+import io
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import synthetic_prototype, synthetic_wordlist
+from src import bitboard
+from src.clues import extract_clues, number_clues
+from src.generator import (
+    _BACKENDS,
+    _find_candidates,
+    _replay,
+    _validate_placement,
+    generate_crossword,
+)
+from src.prototype import run_prototype
+
+# (name, words, rows, cols, puzzles, attempts per puzzle)
+GENERATE_CASES = [
+    ("generate/20w-10x10", 20, 10, 10, 10, 50),
+    ("generate/20w-15x15", 20, 15, 15, 10, 50),
+    ("generate/100w-25x25", 100, 25, 25, 5, 20),
+    ("generate/100w-50x50", 100, 50, 50, 3, 10),
+    ("generate/1000w-50x50", 1000, 50, 50, 2, 2),
+]
+
+# Metric name -> True if higher is better; anything else is informational
+METRICS = {
+    "p50_ms": False, "p95_ms": False, "p50_us": False, "p95_us": False,
+    "peak_kb": False, "attempts_per_s": True, "calls_per_s": True,
+    "combos_per_s": True, "score": True,
+}
+
+
+def percentile(values, q):
+    """Nearest-rank percentile of values (q in 0..100)."""
+    ordered = sorted(values)
+    k = max(0, math.ceil(q / 100 * len(ordered)) - 1)
+    return ordered[k]
+
+
+def peak_kb(fn):
+    """Peak traced allocation while running fn(), in KB."""
+    tracemalloc.start()
+    try:
+        fn()
+        return round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+    finally:
+        tracemalloc.stop()
+
+
+def bench_generate(words, rows, cols, puzzles, attempts, backend):
+    entries = synthetic_wordlist(words, seed=words)
+    latencies = []
+    attempts_run = 0
+    scores = []
+    for seed in range(puzzles):
+        start = time.perf_counter()
+        puzzle = generate_crossword(entries, rows, cols, seed=seed, max_attempts=attempts,
+                                    backend=backend)
+        latencies.append(time.perf_counter() - start)
+        attempts_run += puzzle["metadata"]["attempts"]
+        scores.append(puzzle["metadata"]["score"])
+    return {
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "attempts_per_s": round(attempts_run / sum(latencies), 1),
+        "score": round(sum(scores) / len(scores), 4),
+        "peak_kb": peak_kb(lambda: generate_crossword(entries, rows, cols, seed=0,
+                                                      max_attempts=min(attempts, 5),
+                                                      backend=backend)),
+    }
+
+
+def _mid_state(backend, words=100, rows=25, cols=25):
+    """A realistic search state: the placements of a generated puzzle."""
+    entries = synthetic_wordlist(words, seed=words)
+    puzzle = generate_crossword(entries, rows, cols, seed=0, max_attempts=5)
+    state = _replay(puzzle["placed"], rows, cols, _BACKENDS[backend])
+    return state, [e["word"] for e in entries], rows, cols
+
+
+def _time_calls(calls, repeats):
+    """Per-call seconds for each of `repeats` passes over calls."""
+    per_call = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for fn, args in calls:
+            fn(*args)
+        per_call.append((time.perf_counter() - start) / len(calls))
+    return per_call
+
+
+def _call_metrics(per_call):
+    return {
+        "p50_us": round(percentile(per_call, 50) * 1e6, 2),
+        "p95_us": round(percentile(per_call, 95) * 1e6, 2),
+        "calls_per_s": round(1 / percentile(per_call, 50), 1),
+    }
+
+
+def bench_find_candidates(backend, repeats):
+    state, words, rows, cols = _mid_state(backend)
+    find = _find_candidates if backend == "list" else bitboard.find_candidates
+    return _call_metrics(_time_calls([(find, (state, w, rows, cols)) for w in words], repeats))
+
+
+def bench_validate(backend, repeats):
+    state, words, rows, cols = _mid_state(backend)
+    rng = random.Random(0)
+    calls = []
+    for _ in range(2000):
+        word = rng.choice(words)
+        args = (word, rng.randrange(rows), rng.randrange(cols), rng.choice(("across", "down")),
+                rows, cols)
+        if backend == "list":
+            calls.append((_validate_placement, (state["grid"],) + args))
+        else:
+            calls.append((bitboard.validate_placement, (state,) + args))
+    return _call_metrics(_time_calls(calls, repeats))
+
+
+def bench_clues(fn, repeats):
+    entries = synthetic_wordlist(100, seed=100)
+    puzzles = [generate_crossword(entries, 25, 25, seed=s, max_attempts=3) for s in range(20)]
+    per_call = []
+    for _ in range(repeats):
+        copies = copy.deepcopy(puzzles)
+        start = time.perf_counter()
+        for puzzle in copies:
+            fn(puzzle)
+        per_call.append((time.perf_counter() - start) / len(copies))
+    return _call_metrics(per_call)
+
+
+def bench_prototype(runs, attempts, entries, size, prune=False):
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return run_prototype(entries, size, size, max_attempts=attempts, seed=0,
+                                 prune=prune)
+
+    latencies = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = run()
+        latencies.append(time.perf_counter() - start)
+    proto = result["prototype"]
+    combos = proto["evaluated"] + proto["pruned"]
+    return {
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "combos_per_s": round(combos / percentile(latencies, 50), 1),
+        "pruned": proto["pruned"],
+        "score": result["metadata"]["score"],
+        "peak_kb": peak_kb(run),
+    }
+
+
+def build_cases(quick):
+    """(name, thunk) pairs; quick shrinks budgets for a smoke run."""
+    scale = 0.2 if quick else 1.0
+    repeats = 5 if quick else 20
+    cases = []
+    for name, words, rows, cols, puzzles, attempts in GENERATE_CASES:
+        puzzles = max(2, round(puzzles * scale))
+        attempts = max(1, round(attempts * scale))
+        for backend in ("list", "bitboard"):
+            cases.append((f"{name}[{backend}]",
+                          lambda w=words, r=rows, c=cols, p=puzzles, a=attempts, b=backend:
+                          bench_generate(w, r, c, p, a, b)))
+    for backend in ("list", "bitboard"):
+        cases.append((f"find_candidates[{backend}]",
+                      lambda b=backend: bench_find_candidates(b, repeats)))
+        cases.append((f"validate_placement[{backend}]",
+                      lambda b=backend: bench_validate(b, repeats)))
+    cases.append(("clues/extract_clues", lambda: bench_clues(extract_clues, repeats)))
+    cases.append(("clues/number_clues", lambda: bench_clues(number_clues, repeats)))
+    runs, attempts = (2, 3) if quick else (5, 10)
+    cases.append(("prototype/27-combos",
+                  lambda: bench_prototype(runs, attempts,
+                                          synthetic_prototype(12, 3, alternatives=3, seed=7),
+                                          15)))
+    # Most words are longer than the 8x8 grid; combinations choosing the
+    # oversized alternatives lose too many words to win, so prune skips them
+    oversized = synthetic_prototype(12, 8, alternatives=2, seed=2, max_len=16)
+    for prune in (False, True):
+        cases.append((f"prototype/256-combos[{'prune' if prune else 'full'}]",
+                      lambda p=prune: bench_prototype(runs, attempts, oversized, 8, p)))
+    return cases
+
+
+def compare(results, baseline, threshold):
+    """Return [(case, metric, old, new, change)] for metrics worse than threshold."""
+    regressions = []
+    for case, metrics in results.items():
+        old_metrics = baseline.get(case)
+        if old_metrics is None:
+            continue
+        for metric, new in metrics.items():
+            old = old_metrics.get(metric)
+            if metric not in METRICS or not old:
+                continue
+            change = (new - old) / old
+            worse = -change if METRICS[metric] else change
+            if worse > threshold:
+                regressions.append((case, metric, old, new, change))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the benchmark suite")
+    parser.add_argument("--quick", action="store_true", help="Smaller budgets (smoke run)")
+    parser.add_argument("--only", default=None, help="Run only cases whose name contains this")
+    parser.add_argument("--out", default=os.path.join("benchmarks", "results", "latest.json"),
+                        help="Where to write results (default: benchmarks/results/latest.json)")
+    parser.add_argument("--baseline", default=None, help="Results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="Relative change that counts as a regression (default: 0.15)")
+    args = parser.parse_args()
+
+    results = {}
+    for name, run in build_cases(args.quick):
+        if args.only and args.only not in name:
+            continue
+        metrics = run()
+        results[name] = metrics
+        print(f"{name:<32} " + "  ".join(f"{k}={v}" for k, v in metrics.items()))
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "quick": args.quick,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nSaved to {args.out}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("quick") != args.quick:
+            print("WARNING: baseline and this run differ in --quick; budgets are not comparable")
+        regressions = compare(results, baseline["results"], args.threshold)
+        if not regressions:
+            print(f"No regressions beyond {args.threshold:.0%} against {args.baseline}")
+            return
+        print(f"{len(regressions)} regressions beyond {args.threshold:.0%} against {args.baseline}:")
+        for case, metric, old, new, change in regressions:
+            print(f"  {case}: {metric} {old} -> {new} ({change:+.0%})")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
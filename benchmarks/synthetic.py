@@ -0,0 +1,52 @@
+"""Deterministic synthetic inputs for the benchmarks.
+
+Letters are drawn with roughly English frequencies so words share letters
+about as often as real word lists do.
+"""
+
+import random
+
+# Approximate English letter frequencies (per 1000 letters)
+_LETTER_WEIGHTS = {
+    "E": 127, "T": 91, "A": 82, "O": 75, "I": 70, "N": 67, "S": 63, "H": 61,
+    "R": 60, "D": 43, "L": 40, "C": 28, "U": 28, "M": 24, "W": 24, "F": 22,
+    "G": 20, "Y": 20, "P": 19, "B": 15, "V": 10, "K": 8, "J": 2, "X": 2,
+    "Q": 1, "Z": 1,
+}
+_LETTERS = list(_LETTER_WEIGHTS)
+_WEIGHTS = list(_LETTER_WEIGHTS.values())
+
+
+def synthetic_words(n, seed=0, min_len=3, max_len=10):
+    """n distinct uppercase words with lengths in [min_len, max_len]."""
+    rng = random.Random(seed)
+    words = []
+    seen = set()
+    while len(words) < n:
+        length = rng.randint(min_len, max_len)
+        word = "".join(rng.choices(_LETTERS, _WEIGHTS, k=length))
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+    return words
+
+
+def synthetic_wordlist(n, seed=0, max_len=10):
+    """Entries as returned by load_wordlist: [{"word", "hint"}, ...]."""
+    return [{"word": w, "hint": f"hint for {w.lower()}"}
+            for w in synthetic_words(n, seed, max_len=max_len)]
+
+
+def synthetic_prototype(n, n_multi, alternatives=3, seed=0, max_len=10):
+    """Entries as returned by load_prototype_wordlist.
+
+    The first n_multi entries get `alternatives` words each, so there are
+    alternatives ** n_multi combinations.
+    """
+    words = synthetic_words(n + n_multi * (alternatives - 1), seed, max_len=max_len)
+    entries = []
+    for i in range(n):
+        k = alternatives if i < n_multi else 1
+        entries.append({"words": words[:k], "hint": f"hint {i}"})
+        words = words[k:]
+    return entries
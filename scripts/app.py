@@ -12,9 +12,18 @@ def main():
     parser.add_argument("--input", required=True, help="Path to word+hint CSV")
     parser.add_argument("--rows", type=int, default=15, help="Grid rows (default: 15)")
     parser.add_argument("--cols", type=int, default=15, help="Grid cols (default: 15)")
+    parser.add_argument("--time-budget-ms", type=float, default=None,
+                        help="Cap each New Random generation at this many milliseconds")
+    parser.add_argument("--prefetch", type=int, default=2,
+                        help="Puzzles to generate ahead in the background (default: 2)")
+    parser.add_argument("--history-cap", type=int, default=None,
+                        help="Keep at most N history layouts in memory; older ones "
+                             "go to a temp file (default: no cap)")
     args = parser.parse_args()
 
-    run_viewer(input_path=args.input, rows=args.rows, cols=args.cols)
+    run_viewer(input_path=args.input, rows=args.rows, cols=args.cols,
+               time_budget_ms=args.time_budget_ms, prefetch=args.prefetch,
+               history_cap=args.history_cap)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,103 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.batch import run_batch
+from src.io import load_manifest
+
+
+def parse_seed_range(text):
+    """Parse "A-B" (inclusive) or a single seed into a range."""
+    first, sep, last = text.partition("-")
+    try:
+        first = int(first)
+        last = int(last) if sep else first
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected A-B or N, got {text!r}")
+    if last < first:
+        raise argparse.ArgumentTypeError(f"empty seed range {text!r}")
+    return range(first, last + 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate many crosswords in one process, from a manifest or a seed range"
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--manifest",
+                        help="CSV with header input,name[,rows,cols,seed]; one job per line")
+    source.add_argument("--seeds", type=parse_seed_range,
+                        help="Seed range A-B (inclusive): one job per seed for --input")
+    parser.add_argument("--input", help="Word+hint CSV for --seeds")
+    parser.add_argument("--name", default=None,
+                        help="Output name prefix for --seeds (default: input file name); "
+                             "jobs are named <name>-<seed>")
+    parser.add_argument("--out-dir", default="output", help="Output directory (default: output)")
+    parser.add_argument("--rows", type=int, default=15,
+                        help="Grid rows when the job does not set them (default: 15)")
+    parser.add_argument("--cols", type=int, default=15,
+                        help="Grid cols when the job does not set them (default: 15)")
+    parser.add_argument("--attempts", type=int, default=200, help="Max attempts per puzzle (default: 200)")
+    parser.add_argument("--strategy", choices=["random", "beam", "backtrack"], default="random",
+                        help="Placement strategy (default: random)")
+    parser.add_argument("--beam-width", type=int, default=8,
+                        help="Layouts kept per step with --strategy beam (default: 8)")
+    parser.add_argument("--time-budget-ms", type=float, default=None,
+                        help="Per-puzzle time budget in milliseconds "
+                             "(backtrack: 5000 when not given)")
+    parser.add_argument("--patience", type=int, default=None,
+                        help="Stop a puzzle after N attempts without improvement")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Run jobs on N processes (each puzzle is the same as a serial run)")
+    parser.add_argument("--compact", action="store_true",
+                        help="Write single-line JSON instead of indented")
+    parser.add_argument("--archive", default=None,
+                        help="Write all puzzles, in job order, to this archive file "
+                             "(plus <archive>.idx) instead of one JSON per job")
+    args = parser.parse_args()
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be >= 1")
+
+    if args.manifest:
+        jobs = load_manifest(args.manifest)
+    else:
+        if not args.input:
+            parser.error("--seeds needs --input")
+        prefix = args.name or os.path.splitext(os.path.basename(args.input))[0]
+        jobs = [{"input": args.input, "name": f"{prefix}-{seed}", "rows": None, "cols": None,
+                 "seed": seed} for seed in args.seeds]
+    for job in jobs:
+        job["rows"] = job["rows"] or args.rows
+        job["cols"] = job["cols"] or args.cols
+    print(f"{len(jobs)} jobs, {len({job['input'] for job in jobs})} word lists,"
+          f" workers={args.workers or 1}")
+
+    start = time.perf_counter()
+    job_ms = 0.0
+    placed = total = 0
+    for n, result in enumerate(run_batch(
+        jobs, args.out_dir, workers=args.workers, compact=args.compact, archive=args.archive,
+        max_attempts=args.attempts, strategy=args.strategy, beam_width=args.beam_width,
+        time_budget_ms=args.time_budget_ms, patience=args.patience,
+    ), start=1):
+        job_ms += result["job_ms"]
+        placed += result["placed"]
+        total += result["total"]
+        print(f"[{n}/{len(jobs)}] {result['name']}  score={result['score']:.4f}"
+              f"  placed={result['placed']}/{result['total']}  {result['job_ms']:.0f}ms")
+    elapsed = time.perf_counter() - start
+
+    print()
+    target = args.archive or f"{args.out_dir}/"
+    print(f"Wrote {len(jobs)} puzzles to {target} in {elapsed:.2f}s"
+          f" ({len(jobs) / elapsed:.1f} puzzles/s)")
+    if jobs:
+        print(f"  Mean job time: {job_ms / len(jobs):.1f}ms"
+              f"  |  Words placed: {placed}/{total}")
+
+
+if __name__ == "__main__":
+    main()
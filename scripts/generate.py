@@ -6,8 +6,9 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.io import load_wordlist
 from src.generator import generate_crossword
-from src.clues import extract_clues
+from src.clues import number_clues
 from src.serialize import save_puzzle
+from src.sizing import auto_size, generate_fitted
 
 
 def main():
@@ -16,15 +17,70 @@ def main():
     parser.add_argument("--name", required=True, help="Puzzle name (output filename)")
     parser.add_argument("--rows", type=int, default=15, help="Grid rows (default: 15)")
     parser.add_argument("--cols", type=int, default=15, help="Grid cols (default: 15)")
+    parser.add_argument("--auto-size", action="store_true",
+                        help="Use the smallest grid that places every word instead of "
+                             "--rows/--cols")
+    shape = parser.add_mutually_exclusive_group()
+    shape.add_argument("--square", action="store_true", help="With --auto-size: rows == cols")
+    shape.add_argument("--aspect", type=float, default=None,
+                       help="With --auto-size: keep cols/rows at about this ratio")
+    parser.add_argument("--probe-attempts", type=int, default=20,
+                        help="Attempts per size tried by --auto-size (default: 20)")
     parser.add_argument("--seed", type=int, default=None, help="Random seed")
     parser.add_argument("--attempts", type=int, default=200, help="Max attempts (default: 200)")
+    parser.add_argument("--strategy", choices=["random", "beam", "backtrack"], default="random",
+                        help="Placement strategy (default: random); backtrack runs --attempts "
+                             "greedy attempts, then searches for a layout placing every word "
+                             "until --time-budget-ms (default for backtrack: 5000)")
+    parser.add_argument("--beam-width", type=int, default=8,
+                        help="Layouts kept per step with --strategy beam (default: 8)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Spread attempts over N processes with per-attempt seeds "
+                             "(result is the same for any N)")
+    parser.add_argument("--time-budget-ms", type=float, default=None,
+                        help="Stop generating after this many milliseconds "
+                             "(backtrack: 5000 when not given)")
+    parser.add_argument("--patience", type=int, default=None,
+                        help="Stop after N attempts without improvement")
+    parser.add_argument("--target-score", type=float, default=None,
+                        help="Stop once all words are placed with at least this score")
+    parser.add_argument("--profile", action="store_true",
+                        help="Count and time the search phases (stored in metadata.profile)")
     args = parser.parse_args()
+    if args.profile and args.workers is not None:
+        parser.error("--profile cannot be combined with --workers")
+    if (args.square or args.aspect is not None) and not args.auto_size:
+        parser.error("--square and --aspect need --auto-size")
+    if args.auto_size and args.strategy == "backtrack":
+        parser.error("--auto-size does not support --strategy backtrack")
+    if args.auto_size and not 1 <= args.probe_attempts <= args.attempts:
+        parser.error("--probe-attempts must be between 1 and --attempts")
 
     entries = load_wordlist(args.input)
     print(f"Loaded {len(entries)} words from {args.input}")
 
-    puzzle = generate_crossword(entries, args.rows, args.cols, seed=args.seed, max_attempts=args.attempts)
-    puzzle = extract_clues(puzzle)
+    if args.auto_size:
+        try:
+            size = auto_size(entries, seed=args.seed, probe_attempts=args.probe_attempts,
+                             square=args.square, aspect=args.aspect, workers=args.workers,
+                             strategy=args.strategy, beam_width=args.beam_width)
+        except ValueError as e:
+            sys.exit(f"ERROR: {e}")
+        args.rows, args.cols, args.seed = size["rows"], size["cols"], size["seed"]
+        print(f"Auto size: {args.rows}x{args.cols} after {len(size['probes'])} probes"
+              f" of {args.probe_attempts} attempts")
+
+    options = dict(max_attempts=args.attempts, workers=args.workers,
+                   time_budget_ms=args.time_budget_ms, patience=args.patience,
+                   target_score=args.target_score, strategy=args.strategy,
+                   beam_width=args.beam_width, profile=args.profile)
+    if args.auto_size:
+        puzzle = generate_fitted(entries, size, **options)
+        if puzzle is size["puzzle"]:
+            print("Final run left words out; keeping the fitting probe's layout")
+    else:
+        puzzle = generate_crossword(entries, args.rows, args.cols, seed=args.seed, **options)
+    puzzle = number_clues(puzzle)
 
     out_path = os.path.join("output", f"{args.name}.json")
     save_puzzle(puzzle, out_path)
@@ -34,8 +90,25 @@ def main():
     print(f"  Seed: {puzzle['seed']}")
     print(f"  Placed: {meta['placed']}/{meta['total']} words")
     print(f"  Intersections: {meta['intersections']}")
+    if args.auto_size:
+        filled = sum(cell != "#" for row in puzzle["grid"]["cells"] for cell in row)
+        print(f"  Grid: {args.rows}x{args.cols}, fill density {filled / (args.rows * args.cols):.1%}")
     print(f"  Score: {meta['score']}")
+    print(f"  Attempts: {meta['attempts']}/{meta['max_attempts']} (stop: {meta['stop_reason']})")
     print(f"  Time: {meta['runtime_ms']}ms")
+    if "profile" in meta:
+        print_profile(meta["profile"], meta["runtime_ms"])
+
+
+def print_profile(profile, runtime_ms):
+    print("  Profile:")
+    print(f"    Searches: {profile['searches']}  |  Starts checked: {profile['starts']}"
+          f"  |  Candidates: {profile['candidates']}  |  Placements: {profile['placements']}")
+    rejected = "  ".join(f"{rule}={n}" for rule, n in profile["rejected"].items())
+    print(f"    Rejected: {rejected}")
+    for phase, ms in profile["time_ms"].items():
+        share = ms / runtime_ms if runtime_ms else 0.0
+        print(f"    {phase:<18} {ms:>9.2f}ms  {share:>6.1%}")
 
 
 if __name__ == "__main__":
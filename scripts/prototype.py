@@ -6,7 +6,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.io import load_prototype_wordlist
 from src.prototype import run_prototype, print_prototype_summary, save_selected_csv
-from src.clues import extract_clues
+from src.clues import number_clues
 from src.serialize import save_puzzle
 
 
@@ -21,17 +21,48 @@ def main():
     parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducibility")
     parser.add_argument("--attempts", type=int, default=50,
                         help="Max attempts per combination (default: 50)")
+    parser.add_argument("--prune", action="store_true",
+                        help="Skip combinations whose score upper bound cannot beat the best so far; "
+                             "only helps when alternatives are too long for the grid "
+                             "or share no letters")
+    parser.add_argument("--race", action="store_true",
+                        help="Successive halving: small budgets first, full budget for the winner")
+    parser.add_argument("--race-eta", type=int, default=3,
+                        help="With --race, keep the top 1/ETA each round (default: 3)")
+    parser.add_argument("--race-min-attempts", type=int, default=10,
+                        help="With --race, smallest first-round budget (default: 10)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Evaluate combinations on N processes (same output as serial)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue from prototype_output/<name>.ckpt if present")
+    parser.add_argument("--checkpoint-every", type=float, default=5.0,
+                        help="Seconds between checkpoints (default: 5)")
+    parser.add_argument("--cache-mb", type=float, default=None,
+                        help="Reuse partial layouts shared by neighbouring combinations, up to MB per "
+                             "process (needs --seed)")
     args = parser.parse_args()
+    if args.race_eta < 2:
+        parser.error("--race-eta must be >= 2")
+    if args.race_min_attempts < 1:
+        parser.error("--race-min-attempts must be >= 1")
+    if args.race and (args.resume or args.prune):
+        parser.error("--race cannot be combined with --resume or --prune")
+    if args.prune and args.workers is not None:
+        parser.error("--prune cannot be combined with --workers")
 
     proto_entries = load_prototype_wordlist(args.input)
     multi = sum(1 for e in proto_entries if len(e["words"]) > 1)
     print(f"Loaded {len(proto_entries)} entries ({multi} with alternatives)")
 
+    ckpt_path = None if args.race else os.path.join("prototype_output", f"{args.name}.ckpt")
     result = run_prototype(
         proto_entries, args.rows, args.cols,
-        max_attempts=args.attempts, seed=args.seed,
+        max_attempts=args.attempts, seed=args.seed, prune=args.prune,
+        race=args.race, race_eta=args.race_eta, race_min_attempts=args.race_min_attempts,
+        workers=args.workers, checkpoint_path=ckpt_path,
+        checkpoint_every=args.checkpoint_every, resume=args.resume, cache_mb=args.cache_mb,
     )
-    result = extract_clues(result)
+    result = number_clues(result)
 
     out_path = os.path.join("prototype_output", f"{args.name}.json")
     save_puzzle(result, out_path)
@@ -0,0 +1,85 @@
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.io import load_wordlist
+from src.service import GenerationService, make_server
+
+
+def parse_wordlist_arg(text):
+    """NAME=PATH, or PATH (named after the file)."""
+    name, sep, path = text.partition("=")
+    if not sep:
+        path = text
+        name = os.path.splitext(os.path.basename(text))[0]
+    if not name or not path:
+        raise argparse.ArgumentTypeError(f"expected NAME=PATH or PATH, got {text!r}")
+    return name, path
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serve crossword generation over HTTP/JSON from a warm worker pool"
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Address to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="Port (default: 8000)")
+    parser.add_argument("--wordlist", type=parse_wordlist_arg, action="append", default=[],
+                        metavar="[NAME=]PATH",
+                        help="Pre-register a word+hint CSV (repeatable); requests refer to "
+                             "it by NAME or by its id")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--queue", type=int, default=16,
+                        help="Generations that may wait for a worker before requests get "
+                             "503 (default: 16)")
+    parser.add_argument("--cache-mb", type=float, default=64,
+                        help="Memory for cached seeded responses (default: 64)")
+    parser.add_argument("--wordlist-mb", type=float, default=64,
+                        help="Memory for uploaded word lists; the least recently used are "
+                             "dropped past it (default: 64)")
+    parser.add_argument("--max-size", type=int, default=50,
+                        help="Largest rows/cols a request may ask for (default: 50)")
+    parser.add_argument("--max-attempts", type=int, default=1000,
+                        help="Largest attempts a request may ask for (default: 1000)")
+    parser.add_argument("--max-time-budget-ms", type=float, default=10000,
+                        help="Time budget of every generation; requests may ask for a "
+                             "smaller time_budget_ms (default: 10000)")
+    parser.add_argument("--max-beam-width", type=int, default=64,
+                        help="Largest beam_width a request may ask for (default: 64)")
+    parser.add_argument("--max-upload-kb", type=int, default=1024,
+                        help="Largest request body accepted (default: 1024)")
+    parser.add_argument("--quiet", action="store_true", help="Do not log each request")
+    args = parser.parse_args()
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be >= 1")
+    if args.queue < 0:
+        parser.error("--queue must be >= 0")
+    if args.max_attempts < 1 or args.max_time_budget_ms <= 0 or args.max_beam_width < 1:
+        parser.error("--max-attempts, --max-time-budget-ms and --max-beam-width must be positive")
+
+    service = GenerationService(workers=args.workers, queue_limit=args.queue,
+                                cache_mb=args.cache_mb, max_size=args.max_size,
+                                max_attempts=args.max_attempts,
+                                max_time_budget_ms=args.max_time_budget_ms,
+                                max_beam_width=args.max_beam_width,
+                                wordlist_mb=args.wordlist_mb)
+    for name, path in args.wordlist:
+        info = service.register(load_wordlist(path), name)
+        print(f"Registered {name} ({info['words']} words) as {info['id']}")
+    service.start()
+    server = make_server(service, args.host, args.port, max_body=args.max_upload_kb * 1024,
+                         quiet=args.quiet)
+    print(f"Serving on http://{args.host}:{server.server_port} with {service.workers} workers")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
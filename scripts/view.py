@@ -4,17 +4,31 @@ import sys
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.serialize import load_puzzle
+from src.serialize import ArchiveReader, load_puzzle
 from src.gui import run_viewer
 
 
 def main():
     parser = argparse.ArgumentParser(description="View a saved crossword puzzle")
-    parser.add_argument("--puzzle", required=True, help="Path to puzzle JSON")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--puzzle", help="Path to puzzle JSON")
+    source.add_argument("--archive", help="Path to a puzzle archive; Back/Forward browse it")
+    parser.add_argument("--index", type=int, default=1,
+                        help="With --archive, puzzle number to show first (default: 1)")
     args = parser.parse_args()
 
-    puzzle = load_puzzle(args.puzzle)
-    run_viewer(puzzle=puzzle)
+    if args.puzzle:
+        puzzle = load_puzzle(args.puzzle)
+        run_viewer(puzzle=puzzle)
+        return
+
+    with ArchiveReader(args.archive) as archive:
+        if not 1 <= args.index <= max(1, len(archive)):
+            parser.error(f"--index must be between 1 and {len(archive)}")
+        # Size the canvas for the archive's grid (batches share one size)
+        grid = archive[0]["grid"] if len(archive) else {"rows": 15, "cols": 15}
+        run_viewer(rows=grid["rows"], cols=grid["cols"], archive=archive,
+                   archive_index=args.index - 1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,47 @@
+import asyncio
+import threading
+
+from src.generator import generate_crossword
+
+# Queue marker: the generation has finished (or failed)
+_DONE = object()
+
+
+async def agenerate_crossword(entries, rows, cols, seed=None, max_attempts=200, *,
+                              executor=None, **kwargs):
+    """Async iterator over best-so-far puzzles, ending with the final one.
+
+    Runs generate_crossword(entries, rows, cols, seed, max_attempts, **kwargs)
+    in executor (default: the loop's thread pool), so the result is exactly
+    what the synchronous call returns for the same arguments. Each time an
+    attempt improves on the best so far, that puzzle is yielded with
+    metadata["stop_reason"] None; the last item is the final puzzle.
+
+    Cancelling the consuming task, or closing the iterator early, stops
+    generation after the attempt in progress. The cancel hook is supplied
+    here, so kwargs may not include cancel or on_improve.
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+    cancel = threading.Event()
+
+    def on_improve(puzzle):
+        loop.call_soon_threadsafe(queue.put_nowait, puzzle)
+
+    def run():
+        return generate_crossword(entries, rows, cols, seed, max_attempts, cancel=cancel,
+                                  on_improve=on_improve, **kwargs)
+
+    future = loop.run_in_executor(executor, run)
+    # Done callbacks run on the loop after every call_soon_threadsafe the
+    # worker made, so _DONE is always the last item
+    future.add_done_callback(lambda f: queue.put_nowait(_DONE))
+    try:
+        while True:
+            puzzle = await queue.get()
+            if puzzle is _DONE:
+                break
+            yield puzzle
+        yield future.result()
+    finally:
+        cancel.set()
@@ -0,0 +1,85 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from src.clues import number_clues
+from src.generator import generate_crossword
+from src.io import load_wordlist
+from src.serialize import append_puzzles, save_archive, save_puzzle
+
+# Word lists for pool workers, set once per process by _init_worker
+_worker_wordlists = None
+
+
+def run_batch(jobs, out_dir, workers=None, compact=False, archive=None, **generate_kwargs):
+    """Generate and save one puzzle per job, yielding a summary per job in order.
+
+    jobs: list of {"input", "name", "rows", "cols", "seed"}
+    Each distinct input is loaded once. workers=N runs jobs on N processes
+    that receive the loaded word lists once, at start-up. generate_kwargs
+    (max_attempts, strategy, ...) are passed to generate_crossword.
+    Each summary is {"name", "path", "placed", "total", "score",
+    "runtime_ms", "job_ms"}, where runtime_ms is generation only and job_ms
+    also covers clue extraction and writing the file.
+    archive: write every puzzle, in job order, to a new archive at this path
+    (see save_archive) instead of one JSON file per job in out_dir.
+    """
+    if archive is not None:
+        save_archive([], archive)
+        for summary in _run_jobs(jobs, None, workers, compact, generate_kwargs):
+            append_puzzles([summary.pop("puzzle")], archive)
+            summary["path"] = archive
+            yield summary
+        return
+    yield from _run_jobs(jobs, out_dir, workers, compact, generate_kwargs)
+
+
+def _run_jobs(jobs, out_dir, workers, compact, generate_kwargs):
+    wordlists = {}
+    for job in jobs:
+        if job["input"] not in wordlists:
+            wordlists[job["input"]] = load_wordlist(job["input"])
+
+    if workers is None or workers == 1:
+        _init_worker(wordlists)
+        for job in jobs:
+            yield _run_job(job, out_dir, compact, generate_kwargs)
+        return
+
+    if not jobs:
+        return
+    tasks = [(job, out_dir, compact, generate_kwargs) for job in jobs]
+    chunksize = max(1, min(16, len(jobs) // (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(wordlists,)) as pool:
+        yield from pool.map(_run_job, *zip(*tasks), chunksize=chunksize)
+
+
+def _init_worker(wordlists):
+    global _worker_wordlists
+    _worker_wordlists = wordlists
+
+
+def _run_job(job, out_dir, compact, generate_kwargs):
+    start = time.perf_counter()
+    entries = _worker_wordlists[job["input"]]
+    puzzle = generate_crossword(entries, job["rows"], job["cols"], seed=job["seed"],
+                                **generate_kwargs)
+    puzzle = number_clues(puzzle)
+    out_path = None
+    if out_dir is not None:
+        out_path = os.path.join(out_dir, f"{job['name']}.json")
+        save_puzzle(puzzle, out_path, compact=compact)
+    meta = puzzle["metadata"]
+    summary = {
+        "name": job["name"],
+        "path": out_path,
+        "placed": meta["placed"],
+        "total": meta["total"],
+        "score": meta["score"],
+        "runtime_ms": meta["runtime_ms"],
+        "job_ms": round((time.perf_counter() - start) * 1000, 1),
+    }
+    if out_dir is None:
+        summary["puzzle"] = puzzle
+    return summary
@@ -0,0 +1,244 @@
+"""Flat-array grid backend for the generator.
+
+Letters live in a row-major bytearray (0 = block) and occupancy is mirrored
+as one bitmask per row and per column, so bookend, adjacency and new-cell
+checks are mask operations instead of nested indexing. Candidate order and
+validation results match the list backend exactly, so seeded output is
+identical.
+"""
+
+from bisect import insort
+
+ACROSS = "across"
+DOWN = "down"
+
+
+def new_state(rows, cols):
+    return {
+        "cells": bytearray(rows * cols),
+        "row_masks": [0] * rows,
+        "col_masks": [0] * cols,
+        "index": {},
+        "placed": [],
+        "filled": 0,
+        "intersections": 0,
+        "letters": 0,
+    }
+
+
+def place_word(state, word, row, col, direction):
+    cells = state["cells"]
+    row_masks = state["row_masks"]
+    col_masks = state["col_masks"]
+    index = state["index"]
+    cols = len(col_masks)
+    dr, dc = (0, 1) if direction == ACROSS else (1, 0)
+    new_cells = []
+    for i, ch in enumerate(word):
+        r = row + dr * i
+        c = col + dc * i
+        pos = r * cols + c
+        if not cells[pos]:
+            insort(index.setdefault(ch, []), (r, c))
+            row_masks[r] |= 1 << c
+            col_masks[c] |= 1 << r
+            new_cells.append(i)
+        cells[pos] = ord(ch)
+    state["filled"] += len(new_cells)
+    state["intersections"] += len(word) - len(new_cells)
+    state["letters"] += len(word)
+    return new_cells
+
+
+def unplace_word(state, word, row, col, direction, new_cells):
+    cells = state["cells"]
+    row_masks = state["row_masks"]
+    col_masks = state["col_masks"]
+    index = state["index"]
+    cols = len(col_masks)
+    dr, dc = (0, 1) if direction == ACROSS else (1, 0)
+    for i in new_cells:
+        r = row + dr * i
+        c = col + dc * i
+        index[word[i]].remove((r, c))
+        row_masks[r] &= ~(1 << c)
+        col_masks[c] &= ~(1 << r)
+        cells[r * cols + c] = 0
+    state["filled"] -= len(new_cells)
+    state["intersections"] -= len(word) - len(new_cells)
+    state["letters"] -= len(word)
+
+
+def find_candidates(state, word, rows, cols, rejected=None):
+    # validate_placement inlined per direction: the hot loop only touches
+    # masks until a start survives bounds, bookend, new-cell and adjacency.
+    # With rejected (rule -> count), take the plain path that names the
+    # rule each start fails.
+    if rejected is not None:
+        return _counted_candidates(state, word, rows, cols, rejected)
+    cells = state["cells"]
+    index = state["index"]
+    length = len(word)
+    full = (1 << length) - 1
+    codes = word.encode("ascii")
+    candidates = []
+    for direction in (ACROSS, DOWN):
+        if direction == ACROSS:
+            masks, limit, other, stride, step = state["row_masks"], cols, rows, cols, 1
+        else:
+            masks, limit, other, stride, step = state["col_masks"], rows, cols, 1, cols
+        seen = set()
+        for idx, ch in enumerate(word):
+            for r, c in index.get(ch, ()):
+                if direction == ACROSS:
+                    line, start = r, c - idx
+                else:
+                    line, start = c, r - idx
+                if start < 0 or start + length > limit:
+                    continue
+                key = (line, start)
+                if key in seen:
+                    continue
+                seen.add(key)
+
+                occ = masks[line]
+                if start and occ >> (start - 1) & 1:
+                    continue
+                if occ >> (start + length) & 1:
+                    continue
+                span = full << start
+                shared = occ & span
+                new = span ^ shared
+                if not new:
+                    continue
+                if line and masks[line - 1] & new:
+                    continue
+                if line + 1 < other and masks[line + 1] & new:
+                    continue
+
+                base = line * stride
+                bits = shared
+                while bits:
+                    low = bits & -bits
+                    pos = low.bit_length() - 1
+                    if cells[base + pos * step] != codes[pos - start]:
+                        break
+                    bits ^= low
+                if bits:
+                    continue
+
+                if direction == ACROSS:
+                    candidates.append((line, start, direction, shared.bit_count()))
+                else:
+                    candidates.append((start, line, direction, shared.bit_count()))
+    return candidates
+
+
+def validate_placement(state, word, row, col, direction, rows, cols, rejected=None):
+    """Validate placement and return intersection count, or None if invalid.
+
+    rejected, a dict of rule -> count, tallies the first rule an invalid
+    placement breaks (checked as bounds, bookend, no_new_cell, adjacency,
+    conflict).
+    """
+    length = len(word)
+    if direction == ACROSS:
+        # Along a row: bits index columns, neighbours are the rows above/below
+        masks = state["row_masks"]
+        line, start, limit, other = row, col, cols, rows
+        if row < 0 or col < 0 or col + length > cols:
+            return _reject(rejected, "bounds")
+    else:
+        masks = state["col_masks"]
+        line, start, limit, other = col, row, rows, cols
+        if row < 0 or col < 0 or row + length > rows:
+            return _reject(rejected, "bounds")
+
+    occ = masks[line]
+    # Bookends: cells just before and after the word must be empty or OOB
+    if start > 0 and occ >> (start - 1) & 1:
+        return _reject(rejected, "bookend")
+    if start + length < limit and occ >> (start + length) & 1:
+        return _reject(rejected, "bookend")
+
+    span = ((1 << length) - 1) << start
+    shared = occ & span
+    new = span ^ shared
+    # At least one new cell
+    if not new:
+        return _reject(rejected, "no_new_cell")
+
+    # Parallel adjacency: new cells may not touch a perpendicular neighbour
+    neighbours = 0
+    if line > 0:
+        neighbours |= masks[line - 1]
+    if line + 1 < other:
+        neighbours |= masks[line + 1]
+    if neighbours & new:
+        return _reject(rejected, "adjacency")
+
+    # Letter conflicts on the shared cells only
+    cells = state["cells"]
+    cols_stride = len(state["col_masks"])
+    if direction == ACROSS:
+        base, step = row * cols_stride, 1
+    else:
+        base, step = col, cols_stride
+    bits = shared
+    while bits:
+        low = bits & -bits
+        pos = low.bit_length() - 1
+        if cells[base + pos * step] != ord(word[pos - start]):
+            return _reject(rejected, "conflict")
+        bits ^= low
+
+    return shared.bit_count()
+
+
+def _reject(rejected, rule):
+    """Tally rule in rejected, if counting; returns None (invalid placement)."""
+    if rejected is not None:
+        rejected[rule] += 1
+    return None
+
+
+def _counted_candidates(state, word, rows, cols, rejected):
+    """find_candidates via validate_placement, tallying rejections by rule."""
+    index = state["index"]
+    candidates = []
+    seen = set()
+    for direction in (ACROSS, DOWN):
+        dr, dc = (0, 1) if direction == ACROSS else (1, 0)
+        for idx, ch in enumerate(word):
+            for r, c in index.get(ch, ()):
+                key = (r - dr * idx, c - dc * idx, direction)
+                if key in seen:
+                    continue
+                seen.add(key)
+                result = validate_placement(state, word, key[0], key[1], direction, rows, cols,
+                                            rejected)
+                if result is not None:
+                    candidates.append(key + (result,))
+    return candidates
+
+
+def copy_state(state):
+    return {
+        "cells": bytearray(state["cells"]),
+        "row_masks": list(state["row_masks"]),
+        "col_masks": list(state["col_masks"]),
+        "index": {ch: cells[:] for ch, cells in state["index"].items()},
+        "placed": list(state["placed"]),
+        "filled": state["filled"],
+        "intersections": state["intersections"],
+        "letters": state["letters"],
+    }
+
+
+def state_cells(state):
+    cells = state["cells"]
+    cols = len(state["col_masks"])
+    return [
+        [chr(b) if b else "#" for b in cells[r * cols:(r + 1) * cols]]
+        for r in range(len(state["row_masks"]))
+    ]
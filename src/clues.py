@@ -76,3 +76,80 @@ def extract_clues(puzzle):
     }
 
     return puzzle
+
+
+def number_clues(puzzle):
+    """Same result as extract_clues, computed from puzzle["placed"] alone.
+
+    The letter cells are exactly the cells of the placed words, so they are
+    collected as one occupancy bitmask per row and the start tests of
+    extract_clues become mask operations per row instead of a scan of every
+    cell. The grid is not read and may be left unbuilt (see fill_grid). Use
+    extract_clues for grids that did not come from the generator.
+
+    Modifies puzzle in place: removes 'placed', adds 'clues'.
+    """
+    rows = puzzle["grid"]["rows"]
+    row_masks = [0] * (rows + 2)  # one empty row above and below the grid
+    placement_lookup = {}
+    for p in puzzle["placed"]:
+        r, c, length = p["row"], p["col"], len(p["word"])
+        if p["direction"] == "across":
+            row_masks[r + 1] |= ((1 << length) - 1) << c
+        else:
+            for i in range(r + 1, r + 1 + length):
+                row_masks[i] |= 1 << c
+        placement_lookup[(r, c, p["direction"])] = p
+
+    clues = {"across": [], "down": []}
+    clue_number = 0
+    for r in range(rows):
+        above, occ, below = row_masks[r], row_masks[r + 1], row_masks[r + 2]
+        # Across start: left is '#'/edge and right is a letter; down likewise
+        across = occ & ~(occ << 1) & (occ >> 1)
+        down = occ & ~above & below
+        starts = across | down
+        while starts:
+            low = starts & -starts
+            starts ^= low
+            c = low.bit_length() - 1
+            clue_number += 1
+            for direction, mask in (("across", across), ("down", down)):
+                p = placement_lookup.get((r, c, direction)) if mask & low else None
+                if p:
+                    clues[direction].append({
+                        "number": clue_number,
+                        "answer": p["word"],
+                        "hint": p["hint"],
+                        "row": r,
+                        "col": c,
+                    })
+
+    del puzzle["placed"]
+    puzzle["clues"] = clues
+    return puzzle
+
+
+def fill_grid(puzzle):
+    """Build puzzle["grid"]["cells"] from its words if it is missing.
+
+    Words come from 'placed' if present, else from 'clues'; every other
+    cell is '#'. Returns puzzle.
+    """
+    grid = puzzle["grid"]
+    if "cells" in grid:
+        return puzzle
+    if "placed" in puzzle:
+        words = [(p["word"], p["row"], p["col"], p["direction"]) for p in puzzle["placed"]]
+    else:
+        words = [(clue["answer"], clue["row"], clue["col"], direction)
+                 for direction in ("across", "down")
+                 for clue in puzzle["clues"].get(direction, [])]
+
+    cells = [["#"] * grid["cols"] for _ in range(grid["rows"])]
+    for word, r, c, direction in words:
+        dr, dc = (0, 1) if direction == "across" else (1, 0)
+        for i, ch in enumerate(word):
+            cells[r + dr * i][c + dc * i] = ch
+    grid["cells"] = cells
+    return puzzle
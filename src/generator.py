@@ -1,67 +1,390 @@
 import random
 import time
+from bisect import insort
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from types import SimpleNamespace
+
+from src import bitboard
 
 ACROSS = "across"
 DOWN = "down"
 
+# Upper bound on attempts per worker task, so results stream back steadily
+_MAX_CHUNK = 64
+
+# time_budget_ms used by strategy="backtrack" when none is given
+BACKTRACK_BUDGET_MS = 5000
+
+
+def generate_crossword(entries, rows, cols, seed=None, max_attempts=200, *, backend="list",
+                       workers=None, time_budget_ms=None, patience=None, target_score=None,
+                       strategy="random", beam_width=8, progress=None, cancel=None,
+                       with_grid=True, profile=False, on_improve=None, prefix_cache=None):
+    """Generate a crossword puzzle using best-of-N heuristic placement.
+
+    strategy is "random" (shuffled greedy attempts), "beam" (a beam search
+    per attempt; pass a small max_attempts) or "backtrack" (greedy attempts,
+    then a deadline-bound search for a layout placing every word). backend
+    "list" or "bitboard" gives identical output per seed; workers=N spreads
+    attempts over N processes with per-attempt sub-seeds. time_budget_ms,
+    patience and target_score stop early, recorded in metadata["stop_reason"]
+    and ["attempts"]. progress, cancel and on_improve are called between
+    attempts; with_grid=False leaves out grid["cells"]; profile=True adds
+    metadata["profile"]; prefix_cache (random strategy only) reuses partial
+    layouts across calls. The README describes each option.
+    """
+    if backend not in _BACKENDS:
+        raise ValueError(f"unknown backend {backend!r} (expected one of {sorted(_BACKENDS)})")
+    engine = _BACKENDS[backend]
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers}")
+    if profile and workers is not None:
+        raise ValueError("profile counts calls in this process; it cannot use workers")
+    stats = None
+    if profile:
+        stats = _new_profile()
+        engine = _profiled_engine(engine, stats)
+    if prefix_cache is not None and (strategy != "random" or workers is not None or profile):
+        raise ValueError("prefix_cache needs strategy='random' without workers or profile")
+    if strategy == "random":
+        runner = _run_attempt
+        if prefix_cache is not None:
+            runner = partial(_run_attempt, prefix_cache=prefix_cache)
+    elif strategy == "beam":
+        if beam_width < 1:
+            raise ValueError(f"beam_width must be >= 1, got {beam_width}")
+    elif strategy == "backtrack":
+        if workers is not None:
+            raise ValueError("workers is not supported with strategy='backtrack'")
+    else:
+        raise ValueError(
+            f"unknown strategy {strategy!r} (expected 'random', 'beam' or 'backtrack')"
+        )
 
-def generate_crossword(entries, rows, cols, seed=None, max_attempts=200):
-    """Generate a crossword puzzle using best-of-N heuristic placement."""
     if seed is None:
         seed = random.randint(0, 2**31 - 1)
 
-    rng = random.Random(seed)
     start = time.perf_counter()
-
-    best = None
-    best_score = -1
-    best_attempt = 0
-
-    for attempt in range(max_attempts):
-        result = _run_attempt(entries, rows, cols, rng)
-        score = _score_puzzle(result, len(entries))
-        if score > best_score:
-            best = result
-            best_score = score
-            best_attempt = attempt
+    shape = dict(seed=seed, rows=rows, cols=cols, total=len(entries), max_attempts=max_attempts,
+                 strategy=strategy, engine=engine, with_grid=with_grid, start=start)
+    improved = None
+    if on_improve is not None:
+        def improved(result, score, attempt, attempts_run):
+            on_improve(_build_puzzle(result, score, attempt, attempts_run, None, **shape))
+    deadline = None
+    if strategy == "backtrack" and time_budget_ms is None:
+        time_budget_ms = BACKTRACK_BUDGET_MS
+    if time_budget_ms is not None:
+        deadline = time.time() + time_budget_ms / 1000
+    if strategy == "beam":
+        runner = partial(_run_beam, beam_width=beam_width, deadline=deadline)
+
+    nodes = None
+    if strategy == "backtrack":
+        # Best of max_attempts greedy attempts first: it is the fallback and
+        # steers the search (see _run_backtrack)
+        best, best_score, best_attempt, attempts_run, stop_reason = _select_best(
+            _serial_attempts(entries, rows, cols, seed, max_attempts, engine),
+            len(entries), max_attempts, deadline, None, 0.0, progress, cancel, improved,
+        )
+        nodes = 0
+        if stop_reason == "target_score":
+            stop_reason = "solved"
+        elif stop_reason == "max_attempts":
+            incumbent = best
+            best, stop_reason, nodes = _run_backtrack(entries, rows, cols, random.Random(seed),
+                                                      engine, deadline, incumbent)
+            if best is not incumbent:
+                # Found by the search rather than a greedy attempt
+                best_attempt = None
+        best_score = _score_puzzle(best, len(entries), rows, cols)
+    else:
+        if workers is None:
+            results = _serial_attempts(entries, rows, cols, seed, max_attempts, engine, runner)
+        else:
+            results = _parallel_attempts(entries, rows, cols, seed, max_attempts, backend,
+                                         workers, deadline, runner)
+        best, best_score, best_attempt, attempts_run, stop_reason = _select_best(
+            results, len(entries), max_attempts, deadline, patience, target_score,
+            progress, cancel, improved,
+        )
+
+    puzzle = _build_puzzle(best, best_score, best_attempt, attempts_run, stop_reason, **shape)
+    elapsed_ms = puzzle["metadata"]["runtime_ms"]
+    if nodes is not None:
+        puzzle["metadata"]["nodes"] = nodes
+    if stats is not None:
+        stats["attempts"] = attempts_run
+        stats["starts"] = stats["candidates"] + sum(stats["rejected"].values())
+        times = stats["time_ms"]
+        times["other"] = max(0.0, elapsed_ms - sum(times.values()))
+        stats["time_ms"] = {phase: round(ms, 2) for phase, ms in times.items()}
+        puzzle["metadata"]["profile"] = stats
+    return puzzle
+
+
+def _build_puzzle(best, best_score, best_attempt, attempts_run, stop_reason, *, seed, rows,
+                  cols, total, max_attempts, strategy, engine, with_grid, start):
+    """The puzzle dict generate_crossword returns for the winning state best."""
+    if "index" not in best:
+        # Compact worker result: rebuild the winning grid from its placements
+        best = _replay(best["placed"], rows, cols, engine)
 
     elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
 
-    grid_cells = best["grid"]
     placed = best["placed"]
     total_intersections = sum(p["intersections"] for p in placed)
 
-    return {
+    puzzle = {
         "seed": seed,
         "grid": {
             "rows": rows,
             "cols": cols,
-            "cells": grid_cells,
         },
         "placed": placed,
         "metadata": {
             "placed": len(placed),
-            "total": len(entries),
+            "total": total,
             "best_attempt": best_attempt,
-            "attempts": max_attempts,
+            "attempts": attempts_run,
+            "max_attempts": max_attempts,
+            "stop_reason": stop_reason,
+            "strategy": strategy,
             "intersections": total_intersections,
             "score": round(best_score, 4),
             "runtime_ms": elapsed_ms,
         },
     }
+    if with_grid:
+        puzzle["grid"]["cells"] = engine.state_cells(best)
+    return puzzle
+
+
+def _select_best(results, total_words, max_attempts, deadline, patience, target_score,
+                 progress=None, cancel=None, improved=None):
+    """Consume (attempt, score, result) in attempt order until a stop rule fires.
+
+    improved(result, score, attempt, attempts_run) is called for each new best.
+
+    Returns (best, best_score, best_attempt, attempts_run, stop_reason).
+    """
+    best = None
+    best_score = -1
+    best_attempt = 0
+    attempts_run = 0
+    stop_reason = "max_attempts"
+    for attempt, score, result in results:
+        attempts_run += 1
+        if score > best_score:
+            best = result
+            best_score = score
+            best_attempt = attempt
+            if improved is not None:
+                improved(result, score, attempt, attempts_run)
+        if progress is not None:
+            progress(attempts_run, max_attempts, best_score)
+
+        if cancel is not None and cancel.is_set():
+            stop_reason = "cancelled"
+            break
+        if (target_score is not None and len(best["placed"]) == total_words
+                and best_score >= target_score):
+            stop_reason = "target_score"
+            break
+        if patience is not None and attempt - best_attempt >= patience:
+            stop_reason = "patience"
+            break
+        if deadline is not None and time.time() >= deadline:
+            stop_reason = "time_budget"
+            break
+    else:
+        if attempts_run < max_attempts:
+            # Workers cut their chunks short at the deadline
+            stop_reason = "time_budget"
+    results.close()
+    return best, best_score, best_attempt, attempts_run, stop_reason
+
+
+def _serial_attempts(entries, rows, cols, seed, max_attempts, engine, runner=None):
+    """Yield (attempt, score, state) for attempts drawn from one shared RNG."""
+    if runner is None:
+        runner = _run_attempt
+    rng = random.Random(seed)
+    for attempt in range(max_attempts):
+        result = runner(entries, rows, cols, rng, engine)
+        score = _score_puzzle(result, len(entries), rows, cols)
+        yield attempt, score, result
+
+
+def _attempt_seed(seed, attempt):
+    # str seeds hash through SHA-512, so sub-seeds are stable across processes
+    return f"{seed}/{attempt}"
+
+
+def _run_attempt_chunk(entries, rows, cols, seed, first, count, backend, deadline=None,
+                       runner=None):
+    """Run attempts [first, first + count) with per-attempt sub-seeds.
+
+    Returns (scores, improvements): every score in attempt order, plus the
+    placements of each attempt that beat all earlier ones in the chunk --
+    the only attempts that can become the overall best. Past the deadline
+    (a time.time() value) the chunk returns early, after at least one attempt.
+    """
+    engine = _BACKENDS[backend]
+    if runner is None:
+        runner = _run_attempt
+    scores = []
+    improvements = {}
+    chunk_best = -1
+    for attempt in range(first, first + count):
+        rng = random.Random(_attempt_seed(seed, attempt))
+        result = runner(entries, rows, cols, rng, engine)
+        score = _score_puzzle(result, len(entries), rows, cols)
+        scores.append(score)
+        if score > chunk_best:
+            chunk_best = score
+            improvements[attempt] = result["placed"]
+        if deadline is not None and time.time() >= deadline:
+            break
+    return scores, improvements
+
+
+def _parallel_attempts(entries, rows, cols, seed, max_attempts, backend, workers, deadline=None,
+                       runner=None):
+    """Yield (attempt, score, result) in attempt order from sub-seeded chunks.
+
+    result is {"placed": [...]} for attempts that may be the best, else None.
+    """
+    chunk = max(1, min(_MAX_CHUNK, -(-max_attempts // (workers * 4))))
+    bounds = [(first, min(chunk, max_attempts - first)) for first in range(0, max_attempts, chunk)]
+
+    if workers == 1:
+        chunks = (_run_attempt_chunk(entries, rows, cols, seed, first, count, backend, deadline,
+                                     runner)
+                  for first, count in bounds)
+        yield from _unpack_chunks(bounds, chunks)
+        return
+
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [
+            pool.submit(_run_attempt_chunk, entries, rows, cols, seed, first, count, backend,
+                        deadline, runner)
+            for first, count in bounds
+        ]
+        yield from _unpack_chunks(bounds, (f.result() for f in futures))
+    finally:
+        # Early stop: drop queued chunks instead of running them to completion
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _unpack_chunks(bounds, chunks):
+    for (first, count), (scores, improvements) in zip(bounds, chunks):
+        for offset, score in enumerate(scores):
+            attempt = first + offset
+            placed = improvements.get(attempt)
+            yield attempt, score, {"placed": placed} if placed is not None else None
+        if len(scores) < count:
+            # Chunk hit the deadline; later attempts are not contiguous
+            return
+
+
+def _replay(placed, rows, cols, engine):
+    state = engine.new_state(rows, cols)
+    for p in placed:
+        engine.place_word(state, p["word"], p["row"], p["col"], p["direction"])
+    state["placed"] = list(placed)
+    return state
 
 
 def _make_grid(rows, cols):
     return [["#"] * cols for _ in range(rows)]
 
 
-def _run_attempt(entries, rows, cols, rng):
+def _new_state(rows, cols):
+    """Fresh attempt state: grid, per-letter index of occupied cells, placements.
+
+    The index maps each letter to the row-major sorted list of (r, c) cells
+    holding it, so candidate search only visits cells a word can cross.
+    filled/intersections/letters are running totals kept by _place_word so
+    that _score_puzzle never rescans the grid.
+    """
+    return {
+        "grid": _make_grid(rows, cols),
+        "index": {},
+        "placed": [],
+        "filled": 0,
+        "intersections": 0,
+        "letters": 0,
+    }
+
+
+def _run_attempt(entries, rows, cols, rng, engine=None, prefix_cache=None):
+    if engine is None:
+        engine = _BACKENDS["list"]
+    if prefix_cache is not None:
+        return _run_cached_attempt(entries, rows, cols, rng, engine, prefix_cache)
     order = list(entries)
     rng.shuffle(order)
-    grid = _make_grid(rows, cols)
-    placed = []
-
-    for i, entry in enumerate(order):
+    state = engine.new_state(rows, cols)
+    _place_greedy(state, order, 0, len(order), rows, cols, engine)
+    return state
+
+
+def _run_cached_attempt(entries, rows, cols, rng, engine, cache):
+    """_run_attempt that resumes from the state after the longest cached
+    prefix of its word order, and caches the states at its stops.
+
+    The shuffle draws the same numbers for any list of this length, and
+    placement is deterministic, so the state after a prefix depends only on
+    the words in it. Stops are where the prefix first takes in entries[t:]
+    for some t, i.e. where it would change if only entries after t differed
+    from the last call, as between neighbouring itertools.product combinations.
+    """
+    n = len(entries)
+    perm = list(range(n))
+    rng.shuffle(perm)
+    order = [entries[j] for j in perm]
+    position = [0] * n
+    for i, j in enumerate(perm):
+        position[j] = i
+    stops = {n}
+    first = n
+    for t in range(n - 1, 0, -1):
+        first = min(first, position[t])
+        stops.add(first)
+    stops.discard(0)
+    stops = sorted(stops)
+
+    # new_state identifies the backend; the key spells out the prefix
+    words = tuple((e["word"], e["hint"]) for e in order)
+    state = None
+    done = 0
+    for stop in reversed(stops):
+        cached = cache.get((engine.new_state, rows, cols, words[:stop]))
+        if cached is not None:
+            state = engine.copy_state(cached)
+            done = stop
+            break
+    if state is None:
+        state = engine.new_state(rows, cols)
+    for stop in stops:
+        if stop > done:
+            _place_greedy(state, order, done, stop, rows, cols, engine)
+            cache.put((engine.new_state, rows, cols, words[:stop]), engine.copy_state(state))
+            done = stop
+    return state
+
+
+def _place_greedy(state, order, start, stop, rows, cols, engine):
+    """Place order[start:stop] into state, each at its best candidate; the
+    first word of order goes across, centered."""
+    centrality = _centrality_table(rows, cols)
+    placed = state["placed"]
+
+    for i in range(start, stop):
+        entry = order[i]
         word = entry["word"]
         hint = entry["hint"]
 
@@ -74,7 +397,7 @@ def _run_attempt(entries, rows, cols, rng):
                 continue
             r = rows // 2
             c = (cols - len(word)) // 2
-            _place_word(grid, word, r, c, ACROSS)
+            engine.place_word(state, word, r, c, ACROSS)
             placed.append({
                 "word": word,
                 "hint": hint,
@@ -86,14 +409,13 @@ def _run_attempt(entries, rows, cols, rng):
             continue
 
         # Find all valid candidate placements
-        candidates = _find_candidates(grid, word, rows, cols)
+        candidates = engine.find_candidates(state, word, rows, cols)
         if not candidates:
             continue
 
         # Score and pick best
-        best_cand = max(candidates, key=lambda c: _score_candidate(c, rows, cols))
-        r, c, d, ints = best_cand
-        _place_word(grid, word, r, c, d)
+        r, c, d, ints = engine.best_candidate(candidates, centrality)
+        engine.place_word(state, word, r, c, d)
         placed.append({
             "word": word,
             "hint": hint,
@@ -103,44 +425,287 @@ def _run_attempt(entries, rows, cols, rng):
             "intersections": ints,
         })
 
-    return {"grid": grid, "placed": placed}
 
+def _run_beam(entries, rows, cols, rng, engine=None, beam_width=8, deadline=None):
+    """Beam-search attempt: keep the beam_width best partial layouts per word.
 
-def _place_word(grid, word, row, col, direction):
-    dr, dc = (0, 1) if direction == ACROSS else (1, 0)
-    for i, ch in enumerate(word):
-        grid[row + dr * i][col + dc * i] = ch
+    Past the deadline (a time.time() value) the remaining words are skipped.
+    """
+    if engine is None:
+        engine = _BACKENDS["list"]
+    order = list(entries)
+    rng.shuffle(order)
+    total = len(entries)
+    centrality = _centrality_table(rows, cols)
 
+    # Beam members are never mutated; children are always fresh copies
+    beam = [engine.new_state(rows, cols)]
+    signatures = [frozenset()]
 
-def _find_candidates(grid, word, rows, cols):
+    for entry in order:
+        if deadline is not None and time.time() >= deadline:
+            break
+        word = entry["word"]
+        length = len(word)
+        if length > max(rows, cols):
+            continue
+
+        expansions = []
+        for i, state in enumerate(beam):
+            if not state["placed"]:
+                # First word goes across, centered, exactly as in _run_attempt
+                fits = length <= cols
+                candidates = [(rows // 2, (cols - length) // 2, ACROSS, 0)] if fits else []
+            else:
+                candidates = engine.find_candidates(state, word, rows, cols)
+            if not candidates:
+                expansions.append((_score_puzzle(state, total, rows, cols), -1.0, i, None))
+                continue
+            n_placed = len(state["placed"]) + 1
+            for cand in candidates:
+                ints = cand[3]
+                score = _score_totals(
+                    n_placed, state["intersections"] + ints, state["letters"] + length,
+                    state["filled"] + length - ints, total, rows, cols,
+                )
+                expansions.append((score, _score_candidate(cand, centrality), i, cand))
+
+        # Stable sort: equal keys keep beam order, then candidate order
+        expansions.sort(key=lambda x: (x[0], x[1]), reverse=True)
+
+        next_beam = []
+        next_signatures = []
+        seen = set()
+        for _, _, i, cand in expansions:
+            if cand is None:
+                signature = signatures[i]
+            else:
+                signature = signatures[i] | {(word, cand[0], cand[1], cand[2])}
+            if signature in seen:
+                continue
+            seen.add(signature)
+
+            if cand is None:
+                child = beam[i]
+            else:
+                r, c, d, ints = cand
+                child = engine.copy_state(beam[i])
+                engine.place_word(child, word, r, c, d)
+                child["placed"].append({
+                    "word": word,
+                    "hint": entry["hint"],
+                    "row": r,
+                    "col": c,
+                    "direction": d,
+                    "intersections": ints,
+                })
+            next_beam.append(child)
+            next_signatures.append(signature)
+            if len(next_beam) == beam_width:
+                break
+        beam = next_beam
+        signatures = next_signatures
+
+    return max(beam, key=lambda st: _score_puzzle(st, total, rows, cols))
+
+
+class _SearchTimeout(Exception):
+    pass
+
+
+def _run_backtrack(entries, rows, cols, rng, engine=None, deadline=None, incumbent=None):
+    """Search for a layout that places every word, starting from incumbent.
+
+    Returns (state, stop_reason, nodes): the full layout and "solved", or
+    "exhausted" or "time_budget" with the better-scoring of incumbent and the
+    deepest partial layout found.
+    """
+    if engine is None:
+        engine = _BACKENDS["list"]
+    if any(len(e["word"]) > max(rows, cols) for e in entries):
+        return incumbent or engine.new_state(rows, cols), "exhausted", 0
+    order = list(entries)
+    rng.shuffle(order)
+    letter_sets = {e["word"]: frozenset(e["word"]) for e in order}
+    sharing = {
+        w: sum(1 for o in letter_sets if o != w and letter_sets[o] & ls)
+        for w, ls in letter_sets.items()
+    }
+    order.sort(key=lambda e: (-len(e["word"]), sharing[e["word"]]))
+    preferred = set()
+    if incumbent is not None and incumbent["placed"]:
+        preferred = {(p["word"], p["row"], p["col"], p["direction"]) for p in incumbent["placed"]}
+        first = incumbent["placed"][0]["word"]
+        order.sort(key=lambda e: e["word"] != first)
+    centrality = _centrality_table(rows, cols)
+
+    state = engine.new_state(rows, cols)
+    placed = state["placed"]
+    if not order:
+        return state, "solved", 0
+
+    best = []
+    # Layouts are keyed by an XOR of placement hashes, so the same placements
+    # reached in a different order are not searched twice
+    visited = set()
+    nodes = 0
+
+    def place(entry, r, c, d, ints):
+        new_cells = engine.place_word(state, entry["word"], r, c, d)
+        placed.append({
+            "word": entry["word"],
+            "hint": entry["hint"],
+            "row": r,
+            "col": c,
+            "direction": d,
+            "intersections": ints,
+        })
+        return new_cells
+
+    def unplace(entry, r, c, d, new_cells):
+        placed.pop()
+        engine.unplace_word(state, entry["word"], r, c, d, new_cells)
+
+    def search(remaining, signature, narrow):
+        nonlocal nodes, best
+        nodes += 1
+        if len(placed) > len(best):
+            best = list(placed)
+        if not remaining:
+            return True
+        if deadline is not None and time.time() >= deadline:
+            raise _SearchTimeout
+
+        options = []
+        stuck = []
+        reach = set()
+        for e in remaining:
+            candidates = engine.find_candidates(state, e["word"], rows, cols)
+            if candidates:
+                options.append((len(candidates), e, candidates))
+                reach |= letter_sets[e["word"]]
+            else:
+                stuck.append(letter_sets[e["word"]])
+        while stuck:
+            unreached = [ls for ls in stuck if reach.isdisjoint(ls)]
+            if len(unreached) == len(stuck):
+                return False
+            for ls in stuck:
+                reach |= ls
+            stuck = unreached
+        options.sort(key=lambda o: o[0])
+        if narrow:
+            options = options[:1]
+
+        for _, entry, candidates in options:
+            rest = [e for e in remaining if e is not entry]
+            word = entry["word"]
+            candidates.sort(key=lambda cand: ((word,) + cand[:3] in preferred,
+                                              _score_candidate(cand, centrality)),
+                            reverse=True)
+            for r, c, d, ints in candidates:
+                key = signature ^ hash((word, r, c, d))
+                if key in visited:
+                    continue
+                visited.add(key)
+                new_cells = place(entry, r, c, d, ints)
+                if search(rest, key, narrow):
+                    return True
+                unplace(entry, r, c, d, new_cells)
+        return False
+
+    stop_reason = "exhausted"
+    try:
+        for narrow in (True, False):
+            visited.clear()
+            for anchor in order:
+                word = anchor["word"]
+                if len(word) > cols:
+                    continue
+                r, c = rows // 2, (cols - len(word)) // 2
+                new_cells = place(anchor, r, c, ACROSS, 0)
+                rest = [e for e in order if e is not anchor]
+                if search(rest, hash((word, r, c, ACROSS)), narrow):
+                    return state, "solved", nodes
+                unplace(anchor, r, c, ACROSS, new_cells)
+    except _SearchTimeout:
+        stop_reason = "time_budget"
+    deepest = _replay(best, rows, cols, engine)
+    if incumbent is not None:
+        total = len(entries)
+        if _score_puzzle(incumbent, total, rows, cols) >= _score_puzzle(deepest, total, rows, cols):
+            return incumbent, stop_reason, nodes
+    return deepest, stop_reason, nodes
+
+
+def _place_word(state, word, row, col, direction):
+    grid = state["grid"]
+    index = state["index"]
+    dr, dc = (0, 1) if direction == ACROSS else (1, 0)
+    new_cells = []
+    for i, ch in enumerate(word):
+        r = row + dr * i
+        c = col + dc * i
+        if grid[r][c] == "#":
+            insort(index.setdefault(ch, []), (r, c))
+            new_cells.append(i)
+        grid[r][c] = ch
+    state["filled"] += len(new_cells)
+    state["intersections"] += len(word) - len(new_cells)
+    state["letters"] += len(word)
+    return new_cells
+
+
+def _unplace_word(state, word, row, col, direction, new_cells):
+    """Undo _place_word, given the offsets of the cells it newly filled."""
+    grid = state["grid"]
+    index = state["index"]
+    dr, dc = (0, 1) if direction == ACROSS else (1, 0)
+    for i in new_cells:
+        r = row + dr * i
+        c = col + dc * i
+        index[word[i]].remove((r, c))
+        grid[r][c] = "#"
+    state["filled"] -= len(new_cells)
+    state["intersections"] -= len(word) - len(new_cells)
+    state["letters"] -= len(word)
+
+
+def _find_candidates(state, word, rows, cols, rejected=None):
+    """(row, col, direction, intersections) for each valid start crossing a
+    placed letter. rejected, a dict of rule -> count, tallies the first rule
+    each other start fails (see _validate_placement)."""
+    grid = state["grid"]
+    index = state["index"]
     candidates = []
+    seen = set()
     for direction in (ACROSS, DOWN):
         dr, dc = (0, 1) if direction == ACROSS else (1, 0)
         for idx, ch in enumerate(word):
-            # Find all grid cells matching this letter
-            for r in range(rows):
-                for c in range(cols):
-                    if grid[r][c] != ch:
-                        continue
-                    # Starting position if word[idx] lands on (r, c)
-                    sr = r - dr * idx
-                    sc = c - dc * idx
-                    result = _validate_placement(grid, word, sr, sc, direction, rows, cols)
-                    if result is not None:
-                        candidates.append((sr, sc, direction, result))
-    # Deduplicate
-    seen = set()
-    unique = []
-    for cand in candidates:
-        key = (cand[0], cand[1], cand[2])
-        if key not in seen:
-            seen.add(key)
-            unique.append(cand)
-    return unique
-
-
-def _validate_placement(grid, word, row, col, direction, rows, cols):
-    """Validate placement and return intersection count, or None if invalid."""
+            # Only cells already holding this letter can be crossed
+            for r, c in index.get(ch, ()):
+                # Starting position if word[idx] lands on (r, c)
+                sr = r - dr * idx
+                sc = c - dc * idx
+                # Validity depends only on the start, so skip repeats up front
+                key = (sr, sc, direction)
+                if key in seen:
+                    continue
+                seen.add(key)
+                result = _validate_placement(grid, word, sr, sc, direction, rows, cols,
+                                             rejected)
+                if result is not None:
+                    candidates.append((sr, sc, direction, result))
+    return candidates
+
+
+def _validate_placement(grid, word, row, col, direction, rows, cols, rejected=None):
+    """Validate placement and return intersection count, or None if invalid.
+
+    rejected, a dict of rule -> count, tallies the first rule an invalid
+    placement breaks: "bounds", "bookend", "adjacency", "conflict" or
+    "no_new_cell".
+    """
     dr, dc = (0, 1) if direction == ACROSS else (1, 0)
     length = len(word)
 
@@ -148,16 +713,16 @@ def _validate_placement(grid, word, row, col, direction, rows, cols):
     end_r = row + dr * (length - 1)
     end_c = col + dc * (length - 1)
     if row < 0 or col < 0 or end_r >= rows or end_c >= cols:
-        return None
+        return _reject(rejected, "bounds")
 
     # Rule 4: Bookend — cell before start must be '#' or OOB
     br, bc = row - dr, col - dc
     if 0 <= br < rows and 0 <= bc < cols and grid[br][bc] != "#":
-        return None
+        return _reject(rejected, "bookend")
     # Cell after end must be '#' or OOB
     ar, ac = row + dr * length, col + dc * length
     if 0 <= ar < rows and 0 <= ac < cols and grid[ar][ac] != "#":
-        return None
+        return _reject(rejected, "bookend")
 
     intersections = 0
     new_cells = 0
@@ -175,46 +740,167 @@ def _validate_placement(grid, word, row, col, direction, rows, cols):
             for sign in (-1, 1):
                 nr, nc = r + pr * sign, c + pc * sign
                 if 0 <= nr < rows and 0 <= nc < cols and grid[nr][nc] != "#":
-                    return None
+                    return _reject(rejected, "adjacency")
         elif cell == word[i]:
             intersections += 1
         else:
             # Rule 2: Letter conflict
-            return None
+            return _reject(rejected, "conflict")
 
     # Rule 5: At least one new cell
     if new_cells == 0:
-        return None
+        return _reject(rejected, "no_new_cell")
 
     return intersections
 
 
-def _score_candidate(candidate, rows, cols):
-    r, c, direction, intersections = candidate
+def _reject(rejected, rule):
+    """Tally rule in rejected, if counting; returns None (invalid placement)."""
+    if rejected is not None:
+        rejected[rule] += 1
+    return None
+
+
+@lru_cache(maxsize=32)
+def _centrality_table(rows, cols):
+    """Per-cell centrality (1 at the centre, 0 at the far corner) for a grid size."""
     center_r, center_c = rows / 2, cols / 2
-    dist = abs(r - center_r) + abs(c - center_c)
     max_dist = center_r + center_c
-    centrality = 1.0 - dist / max_dist if max_dist > 0 else 1.0
-    return 2.0 * intersections + 1.0 * centrality
+    table = []
+    for r in range(rows):
+        row = []
+        for c in range(cols):
+            dist = abs(r - center_r) + abs(c - center_c)
+            row.append(1.0 - dist / max_dist if max_dist > 0 else 1.0)
+        table.append(tuple(row))
+    return tuple(table)
+
+
+def _score_candidate(candidate, centrality):
+    r, c, direction, intersections = candidate
+    return 2.0 * intersections + 1.0 * centrality[r][c]
+
 
+def _best_candidate(candidates, centrality):
+    return max(candidates, key=lambda c: _score_candidate(c, centrality))
 
-def _score_puzzle(result, total_words):
-    placed = result["placed"]
-    grid = result["grid"]
-    n_placed = len(placed)
 
+def _score_puzzle(state, total_words, rows, cols):
+    return _score_totals(len(state["placed"]), state["intersections"], state["letters"],
+                         state["filled"], total_words, rows, cols)
+
+
+def _score_totals(n_placed, total_intersections, total_letters, filled, total_words, rows, cols):
     if total_words == 0:
         return 0.0
 
     placed_ratio = n_placed / total_words
 
-    total_intersections = sum(p["intersections"] for p in placed)
-    total_letters = sum(len(p["word"]) for p in placed)
     intersection_density = total_intersections / total_letters if total_letters > 0 else 0
 
-    rows = len(grid)
-    cols = len(grid[0]) if rows > 0 else 0
-    filled = sum(1 for r in grid for c in r if c != "#")
     fill_density = filled / (rows * cols) if rows * cols > 0 else 0
 
     return 0.50 * placed_ratio + 0.30 * intersection_density + 0.20 * fill_density
+
+
+def _state_cells(state):
+    return state["grid"]
+
+
+def _copy_state(state):
+    return {
+        "grid": [row[:] for row in state["grid"]],
+        "index": {ch: cells[:] for ch, cells in state["index"].items()},
+        "placed": list(state["placed"]),
+        "filled": state["filled"],
+        "intersections": state["intersections"],
+        "letters": state["letters"],
+    }
+
+
+# Grid engines: the functions _run_attempt and generate_crossword need from a
+# backend. Both share candidate order, so they are interchangeable per seed.
+_BACKENDS = {
+    "list": SimpleNamespace(
+        new_state=_new_state,
+        place_word=_place_word,
+        unplace_word=_unplace_word,
+        find_candidates=_find_candidates,
+        best_candidate=_best_candidate,
+        state_cells=_state_cells,
+        copy_state=_copy_state,
+    ),
+    "bitboard": SimpleNamespace(
+        new_state=bitboard.new_state,
+        place_word=bitboard.place_word,
+        unplace_word=bitboard.unplace_word,
+        find_candidates=bitboard.find_candidates,
+        best_candidate=_best_candidate,
+        state_cells=bitboard.state_cells,
+        copy_state=bitboard.copy_state,
+    ),
+}
+
+
+# Validation rules counted by find_candidates(..., rejected=)
+_RULES = ("bounds", "bookend", "conflict", "adjacency", "no_new_cell")
+
+
+def _new_profile():
+    return {
+        "attempts": 0,
+        "searches": 0,
+        "starts": 0,
+        "candidates": 0,
+        "placements": 0,
+        "rejected": dict.fromkeys(_RULES, 0),
+        "time_ms": dict.fromkeys(
+            ("candidate_search", "candidate_scoring", "placement", "state_copy"), 0.0
+        ),
+    }
+
+
+def _profiled_engine(engine, profile):
+    """Wrap engine so its calls are counted and timed into profile.
+
+    Phases: candidate_search (find_candidates, validation included),
+    candidate_scoring (best_candidate; beam and backtrack rank inline, so
+    theirs lands in "other"), placement (place/unplace) and state_copy.
+    Searches pass rejected= so each rejected start is tallied by the rule
+    that stopped it, in the same pass. The unprofiled path never touches
+    any of this.
+    """
+    times = profile["time_ms"]
+    rejected = profile["rejected"]
+
+    def timed(phase, fn):
+        def wrapper(*args):
+            start = time.perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                times[phase] += (time.perf_counter() - start) * 1000
+        return wrapper
+
+    search = timed("candidate_search", partial(engine.find_candidates, rejected=rejected))
+    place = timed("placement", engine.place_word)
+
+    def find_candidates(state, word, rows, cols):
+        candidates = search(state, word, rows, cols)
+        profile["searches"] += 1
+        profile["candidates"] += len(candidates)
+        return candidates
+
+    def place_word(state, word, row, col, direction):
+        profile["placements"] += 1
+        return place(state, word, row, col, direction)
+
+    return SimpleNamespace(
+        new_state=engine.new_state,
+        place_word=place_word,
+        unplace_word=timed("placement", engine.unplace_word),
+        find_candidates=find_candidates,
+        best_candidate=timed("candidate_scoring", engine.best_candidate),
+        state_cells=engine.state_cells,
+        copy_state=timed("state_copy", engine.copy_state),
+    )
@@ -1,37 +1,139 @@
+import threading
 import tkinter as tk
-from tkinter import filedialog, messagebox
+from collections import deque
+from tkinter import filedialog, messagebox, ttk
 
 from src.io import load_wordlist
 from src.generator import generate_crossword
-from src.clues import extract_clues
+from src.clues import number_clues
+from src.history import SessionHistory
 from src.serialize import save_puzzle
 
 
 CELL_SIZE = 36
 NUMBER_FONT_SIZE = 8
 LETTER_FONT_SIZE = 14
+POLL_MS = 50
+
+
+class _BackgroundGenerator:
+    """Generates puzzles on a worker thread into a bounded ready queue.
+
+    The worker keeps up to prefetch finished puzzles ready (at least one
+    once asked for, see take). cancel() abandons the generation in flight
+    and pauses the worker until the next take(). progress is
+    (attempts_run, max_attempts, best_score) of the generation in flight,
+    or None. All methods are called from the Tk thread.
+    """
+
+    def __init__(self, entries, rows, cols, time_budget_ms=None, prefetch=2):
+        self.entries = entries
+        self.rows = rows
+        self.cols = cols
+        self.time_budget_ms = time_budget_ms
+        self.prefetch = prefetch
+        self.progress = None
+        self._ready = deque()
+        self._wanted = 0
+        self._paused = False
+        self._closed = False
+        self._cancel = None
+        self._cond = threading.Condition()
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def take(self):
+        """Pop a finished puzzle, or return None and make sure one is coming."""
+        with self._cond:
+            self._paused = False
+            if self._ready:
+                puzzle = self._ready.popleft()
+            else:
+                puzzle = None
+                self._wanted = 1
+            self._cond.notify()
+            return puzzle
+
+    def cancel(self):
+        with self._cond:
+            self._paused = True
+            self._wanted = 0
+            if self._cancel is not None:
+                self._cancel.set()
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            if self._cancel is not None:
+                self._cancel.set()
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._closed and (
+                    self._paused or len(self._ready) >= max(self.prefetch, self._wanted)
+                ):
+                    self._cond.wait()
+                if self._closed:
+                    return
+                cancel = self._cancel = threading.Event()
+            puzzle = generate_crossword(self.entries, self.rows, self.cols,
+                                        time_budget_ms=self.time_budget_ms,
+                                        progress=self._report, cancel=cancel)
+            puzzle = number_clues(puzzle)
+            with self._cond:
+                self._cancel = None
+                self.progress = None
+                if not cancel.is_set():
+                    self._ready.append(puzzle)
+                    self._wanted = 0
+
+    def _report(self, attempts_run, max_attempts, best_score):
+        self.progress = (attempts_run, max_attempts, best_score)
 
 
 class CrosswordViewer:
-    def __init__(self, root, puzzle=None, *, input_path=None, rows=15, cols=15):
+    def __init__(self, root, puzzle=None, *, input_path=None, rows=15, cols=15,
+                 time_budget_ms=None, archive=None, archive_index=0, prefetch=2,
+                 history_cap=None):
         self.root = root
         self.input_path = input_path
         self.rows = rows
         self.cols = cols
+        self.time_budget_ms = time_budget_ms
         self.entries = None
-
-        # History
-        self.history = []
+        self.generator = None
+        self.waiting = False
+
+        # Canvas items per cell, created once per grid size (see _draw_grid)
+        self._grid_size = None
+        self._cell_items = []
+        self._cell_shown = []
+
+        # History. An archive (any sequence, e.g. ArchiveReader) takes its
+        # place: Back/Forward step through it and only the shown puzzle is decoded.
+        self.archive = archive
+        self.history = SessionHistory(max_in_memory=history_cap)
         self.history_index = -1
+        if archive is not None:
+            self.history = archive
+            self.history_index = archive_index
 
         # Load entries if in app mode
         if input_path:
             self.entries = load_wordlist(input_path)
+            self.generator = _BackgroundGenerator(self.entries, rows, cols, time_budget_ms,
+                                                  prefetch)
+            self.root.protocol("WM_DELETE_WINDOW", self._close)
 
         self.root.title("Crossword Generator")
         self._build_ui()
 
-        if puzzle:
+        if archive is not None:
+            if len(archive):
+                self._display_puzzle(archive[archive_index])
+            self._update_buttons()
+        elif puzzle:
             self._push_puzzle(puzzle)
         elif self.entries:
             self._generate_new()
@@ -56,6 +158,16 @@ class CrosswordViewer:
         self.meta_label = tk.Label(toolbar, text="", anchor=tk.W)
         self.meta_label.pack(side=tk.LEFT, padx=20, fill=tk.X, expand=True)
 
+        # Generation status (bottom); only filled while waiting for a puzzle
+        status = tk.Frame(self.root)
+        status.pack(side=tk.BOTTOM, fill=tk.X, padx=5, pady=(0, 5))
+        self.progress_bar = ttk.Progressbar(status, length=200, mode="determinate")
+        self.progress_bar.pack(side=tk.LEFT)
+        self.btn_cancel = tk.Button(status, text="Cancel", command=self._cancel_generation)
+        self.btn_cancel.pack(side=tk.LEFT, padx=5)
+        self.status_label = tk.Label(status, text="", anchor=tk.W)
+        self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+
         # Main content area
         content = tk.Frame(self.root)
         content.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=5, pady=5)
@@ -97,7 +209,7 @@ class CrosswordViewer:
 
     def _push_puzzle(self, puzzle):
         # Truncate forward history (browser-style)
-        self.history = self.history[:self.history_index + 1]
+        self.history.truncate(self.history_index + 1)
         self.history.append(puzzle)
         self.history_index = len(self.history) - 1
         self._display_puzzle(puzzle)
@@ -109,10 +221,11 @@ class CrosswordViewer:
         self._update_meta(puzzle)
 
     def _draw_grid(self, puzzle):
-        self.canvas.delete("all")
         cells = puzzle["grid"]["cells"]
         r_count = puzzle["grid"]["rows"]
         c_count = puzzle["grid"]["cols"]
+        if self._grid_size != (r_count, c_count):
+            self._build_grid_items(r_count, c_count)
 
         # Build number map from clues
         number_map = {}
@@ -123,27 +236,51 @@ class CrosswordViewer:
             if pos not in number_map:
                 number_map[pos] = clue["number"]
 
+        # Only touch cells whose letter or number changed since the last draw
+        itemconfig = self.canvas.itemconfig
         for r in range(r_count):
+            row = cells[r]
+            shown = self._cell_shown[r]
+            items = self._cell_items[r]
+            for c in range(c_count):
+                cell = row[c]
+                num = number_map.get((r, c))
+                if shown[c] == (cell, num):
+                    continue
+                shown[c] = (cell, num)
+                rect, letter, number = items[c]
+                if cell == "#":
+                    itemconfig(rect, fill="black", outline="black")
+                    itemconfig(letter, text="")
+                    itemconfig(number, text="")
+                else:
+                    itemconfig(rect, fill="white", outline="gray")
+                    itemconfig(letter, text=cell)
+                    itemconfig(number, text="" if num is None else str(num))
+
+    def _build_grid_items(self, r_count, c_count):
+        """Create the rectangle, letter and number items for every cell, all blank."""
+        self.canvas.delete("all")
+        self.canvas.config(width=c_count * CELL_SIZE + 2, height=r_count * CELL_SIZE + 2)
+        self._grid_size = (r_count, c_count)
+        self._cell_items = []
+        self._cell_shown = []
+        for r in range(r_count):
+            items = []
             for c in range(c_count):
                 x1 = c * CELL_SIZE + 1
                 y1 = r * CELL_SIZE + 1
                 x2 = x1 + CELL_SIZE
                 y2 = y1 + CELL_SIZE
-                cell = cells[r][c]
-
-                if cell == "#":
-                    self.canvas.create_rectangle(x1, y1, x2, y2, fill="black", outline="black")
-                else:
-                    self.canvas.create_rectangle(x1, y1, x2, y2, fill="white", outline="gray")
-                    # Letter
-                    self.canvas.create_text(x1 + CELL_SIZE // 2, y1 + CELL_SIZE // 2 + 2,
-                                            text=cell, font=("Courier", LETTER_FONT_SIZE, "bold"))
-                    # Clue number
-                    num = number_map.get((r, c))
-                    if num is not None:
-                        self.canvas.create_text(x1 + 4, y1 + 3, text=str(num),
-                                                font=("TkDefaultFont", NUMBER_FONT_SIZE),
-                                                anchor=tk.NW)
+                rect = self.canvas.create_rectangle(x1, y1, x2, y2, fill="black", outline="black")
+                letter = self.canvas.create_text(x1 + CELL_SIZE // 2, y1 + CELL_SIZE // 2 + 2,
+                                                 text="", font=("Courier", LETTER_FONT_SIZE, "bold"))
+                number = self.canvas.create_text(x1 + 4, y1 + 3, text="",
+                                                 font=("TkDefaultFont", NUMBER_FONT_SIZE),
+                                                 anchor=tk.NW)
+                items.append((rect, letter, number))
+            self._cell_items.append(items)
+            self._cell_shown.append([("#", None)] * c_count)
 
     def _draw_clues(self, puzzle):
         clues = puzzle.get("clues", {})
@@ -168,8 +305,11 @@ class CrosswordViewer:
         score = meta.get("score", "?")
         ints = meta.get("intersections", "?")
         ms = meta.get("runtime_ms", "?")
+        position = ""
+        if self.archive is not None:
+            position = f"#{self.history_index + 1}/{len(self.archive)}  |  "
         self.meta_label.config(
-            text=f"Seed: {seed}  |  Placed: {placed}/{total}  |  "
+            text=f"{position}Seed: {seed}  |  Placed: {placed}/{total}  |  "
                  f"Intersections: {ints}  |  Score: {score}  |  {ms}ms"
         )
 
@@ -179,7 +319,8 @@ class CrosswordViewer:
         self.btn_forward.config(
             state=tk.NORMAL if self.history_index < len(self.history) - 1 else tk.DISABLED
         )
-        self.btn_new.config(state=tk.NORMAL if has_entries else tk.DISABLED)
+        self.btn_new.config(state=tk.NORMAL if has_entries and not self.waiting else tk.DISABLED)
+        self.btn_cancel.config(state=tk.NORMAL if self.waiting else tk.DISABLED)
         self.btn_save.config(state=tk.NORMAL if self.history else tk.DISABLED)
 
     def _go_back(self):
@@ -195,11 +336,51 @@ class CrosswordViewer:
             self._update_buttons()
 
     def _generate_new(self):
-        if not self.entries:
+        if not self.entries or self.waiting:
+            return
+        puzzle = self.generator.take()
+        if puzzle is not None:
+            self._push_puzzle(puzzle)
+            return
+        self.waiting = True
+        self._update_buttons()
+        self._poll_generator()
+
+    def _poll_generator(self):
+        if not self.waiting:
+            return
+        puzzle = self.generator.take()
+        if puzzle is not None:
+            self.waiting = False
+            self.progress_bar.config(value=0)
+            self.status_label.config(text="")
+            self._push_puzzle(puzzle)
             return
-        puzzle = generate_crossword(self.entries, self.rows, self.cols)
-        puzzle = extract_clues(puzzle)
-        self._push_puzzle(puzzle)
+        progress = self.generator.progress
+        if progress is not None:
+            attempts_run, max_attempts, best_score = progress
+            self.progress_bar.config(maximum=max_attempts, value=attempts_run)
+            self.status_label.config(
+                text=f"Generating... {attempts_run}/{max_attempts} attempts,"
+                     f" best score {best_score:.4f}"
+            )
+        else:
+            self.status_label.config(text="Generating...")
+        self.root.after(POLL_MS, self._poll_generator)
+
+    def _cancel_generation(self):
+        if not self.waiting:
+            return
+        self.generator.cancel()
+        self.waiting = False
+        self.progress_bar.config(value=0)
+        self.status_label.config(text="Cancelled")
+        self._update_buttons()
+
+    def _close(self):
+        self.generator.close()
+        self.history.close()
+        self.root.destroy()
 
     def _save_puzzle(self):
         if not self.history:
@@ -217,8 +398,12 @@ class CrosswordViewer:
             messagebox.showinfo("Saved", f"Puzzle saved to {path}")
 
 
-def run_viewer(puzzle=None, *, input_path=None, rows=15, cols=15):
+def run_viewer(puzzle=None, *, input_path=None, rows=15, cols=15, time_budget_ms=None,
+               archive=None, archive_index=0, prefetch=2, history_cap=None):
     """Launch the crossword viewer GUI."""
     root = tk.Tk()
-    CrosswordViewer(root, puzzle=puzzle, input_path=input_path, rows=rows, cols=cols)
+    CrosswordViewer(root, puzzle=puzzle, input_path=input_path, rows=rows, cols=cols,
+                    time_budget_ms=time_budget_ms, archive=archive,
+                    archive_index=archive_index, prefetch=prefetch,
+                    history_cap=history_cap)
     root.mainloop()
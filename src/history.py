@@ -0,0 +1,104 @@
+import json
+import tempfile
+import zlib
+from collections import OrderedDict
+
+from src.clues import fill_grid
+
+
+class SessionHistory:
+    """Compact list of puzzles for the viewer's Back/Forward history.
+
+    Each puzzle is stored as zlib-compressed JSON without its grid: the grid
+    is rebuilt from the clue answers on decode (src.clues.fill_grid).
+    Puzzles whose grid does not match their clues, e.g. when one word
+    extends another, keep packed grid rows instead. The last cache_size
+    decoded puzzles are kept in an LRU, so stepping back and forth around
+    the current index does not decode.
+    With max_in_memory, older encoded entries beyond that count are written
+    to an anonymous temp file and read back on demand.
+    """
+
+    def __init__(self, max_in_memory=None, cache_size=8):
+        self.max_in_memory = max_in_memory
+        self.cache_size = cache_size
+        # Encoded bytes, or (offset, length) in the spill file for the
+        # first _spilled entries
+        self._entries = []
+        self._spilled = 0
+        self._spill = None
+        self._cache = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self._entries)
+        if not 0 <= i < len(self._entries):
+            raise IndexError(f"history index out of range: {i}")
+        puzzle = self._cache.get(i)
+        if puzzle is not None:
+            self._cache.move_to_end(i)
+            return puzzle
+        entry = self._entries[i]
+        if isinstance(entry, tuple):
+            offset, length = entry
+            self._spill.seek(offset)
+            entry = self._spill.read(length)
+        puzzle = decode_puzzle(entry)
+        self._remember(i, puzzle)
+        return puzzle
+
+    def append(self, puzzle):
+        self._entries.append(encode_puzzle(puzzle))
+        self._remember(len(self._entries) - 1, puzzle)
+        if self.max_in_memory is not None:
+            self._spill_oldest()
+
+    def truncate(self, n):
+        """Drop entries from index n on (spilled bytes stay in the file)."""
+        del self._entries[n:]
+        self._spilled = min(self._spilled, len(self._entries))
+        for i in [i for i in self._cache if i >= n]:
+            del self._cache[i]
+
+    def close(self):
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+
+    def _remember(self, i, puzzle):
+        self._cache[i] = puzzle
+        self._cache.move_to_end(i)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _spill_oldest(self):
+        while len(self._entries) - self._spilled > self.max_in_memory:
+            if self._spill is None:
+                self._spill = tempfile.TemporaryFile()
+            entry = self._entries[self._spilled]
+            offset = self._spill.seek(0, 2)
+            self._spill.write(entry)
+            self._entries[self._spilled] = (offset, len(entry))
+            self._spilled += 1
+
+
+def encode_puzzle(puzzle):
+    """Compress a puzzle dict (with clues) to bytes; see decode_puzzle."""
+    grid = puzzle["grid"]
+    stored = dict(puzzle, grid={"rows": grid["rows"], "cols": grid["cols"]})
+    probe = {"grid": dict(stored["grid"]), "clues": puzzle.get("clues", {})}
+    if fill_grid(probe)["grid"]["cells"] != grid["cells"]:
+        stored["grid"] = dict(grid, cells=["".join(row) for row in grid["cells"]])
+    return zlib.compress(json.dumps(stored, separators=(",", ":")).encode("utf-8"))
+
+
+def decode_puzzle(data):
+    puzzle = json.loads(zlib.decompress(data))
+    grid = puzzle["grid"]
+    if "cells" in grid:
+        grid["cells"] = [list(row) for row in grid["cells"]]
+        return puzzle
+    return fill_grid(puzzle)
@@ -1,69 +1,137 @@
+import csv
+import json
+import os
 import re
 import sys
 
+# Normalization: uppercase, then keep A-Z only. ASCII text goes through one
+# str.translate; anything else falls back to upper() + regex, because
+# upper() can turn non-ASCII letters into A-Z (e.g. "ß" -> "SS").
+_ASCII_WORD = {i: (chr(i).upper() if chr(i).isalpha() else None) for i in range(128)}
+_NON_LETTERS = re.compile(r"[^A-Z]")
 
-def load_wordlist(path):
+# Bump when the cached form or the parsing rules change
+_CACHE_VERSION = 1
+
+
+def normalize_word(raw):
+    """Uppercase raw and drop everything but A-Z."""
+    if raw.isascii():
+        return raw.translate(_ASCII_WORD)
+    return _NON_LETTERS.sub("", raw.upper())
+
+
+def load_wordlist(path, cache=True):
     """Load word+hint pairs from a CSV file.
 
     Each line: word,hint (split on first comma; hints may contain commas).
     Words are normalized to uppercase A-Z. Duplicates and short words are rejected.
+    With cache=True the parsed entries are kept in a cache file next to the
+    input (see _read_cache) and reused while the input's mtime and size
+    are unchanged.
     """
-    entries = []
-    seen = set()
+    if cache:
+        cached = _read_cache(path, "wordlist")
+        if cached is not None:
+            for word in cached["duplicates"]:
+                _warn_duplicate(word)
+            return cached["entries"]
+
+    stat = os.stat(path)
+    duplicates = []
+
+    def on_duplicate(word):
+        duplicates.append(word)
+        _warn_duplicate(word)
+
+    entries = list(iter_wordlist(path, on_duplicate))
+    if cache:
+        _write_cache(path, stat, "wordlist", {
+            "entries": entries,
+            "duplicates": duplicates,
+        })
+    return entries
+
 
+def iter_wordlist(path, on_duplicate=None):
+    """Yield {"word", "hint"} entries of a word+hint CSV one line at a time.
+
+    Same rules as load_wordlist, without the cache. on_duplicate(word) is
+    called for each duplicate skipped (default: print a warning).
+    """
     with open(path, encoding="utf-8-sig") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
+        yield from _parse_wordlist_lines(f, on_duplicate)
 
-            parts = line.split(",", 1)
-            if len(parts) < 2:
-                continue
 
-            raw_word, hint = parts[0].strip(), parts[1].strip()
-            word = re.sub(r"[^A-Z]", "", raw_word.upper())
+def parse_wordlist(text, on_duplicate=None):
+    """Entries of word+hint CSV text (e.g. an upload), same rules as load_wordlist."""
+    return list(_parse_wordlist_lines(text.lstrip("\ufeff").splitlines(), on_duplicate))
 
-            if len(word) < 2:
-                continue
 
-            if word in seen:
-                print(f"WARNING: duplicate word '{word}' skipped", file=sys.stderr)
-                continue
+def _parse_wordlist_lines(lines, on_duplicate):
+    if on_duplicate is None:
+        on_duplicate = _warn_duplicate
+    seen = set()
 
-            seen.add(word)
-            entries.append({"word": word, "hint": hint})
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
 
-    return entries
+        raw_word, sep, hint = line.partition(",")
+        if not sep:
+            continue
 
+        word = normalize_word(raw_word)
 
-def load_prototype_wordlist(path):
+        if len(word) < 2:
+            continue
+
+        if word in seen:
+            on_duplicate(word)
+            continue
+
+        seen.add(word)
+        yield {"word": word, "hint": hint.strip()}
+
+
+def load_prototype_wordlist(path, cache=True):
     """Load word+hint pairs where each word field may have /‑separated alternatives.
 
     Format: word1/word2/word3,hint (split on first comma, then / for alternatives).
     Each alternative is normalized to uppercase A-Z independently.
     Returns list of {"words": [str, ...], "hint": str}.
+    cache works as in load_wordlist.
     """
-    entries = []
+    if cache:
+        cached = _read_cache(path, "prototype")
+        if cached is not None:
+            return cached["entries"]
+
+    stat = os.stat(path)
+    entries = list(iter_prototype_wordlist(path))
+    if cache:
+        _write_cache(path, stat, "prototype", {"entries": entries})
+    return entries
 
+
+def iter_prototype_wordlist(path):
+    """Yield {"words", "hint"} entries of a prototype file one line at a time."""
     with open(path, encoding="utf-8-sig") as f:
         for line in f:
             line = line.strip()
             if not line:
                 continue
 
-            parts = line.split(",", 1)
-            if len(parts) < 2:
+            raw_word_field, sep, hint = line.partition(",")
+            if not sep:
                 continue
 
-            raw_word_field, hint = parts[0].strip(), parts[1].strip()
-
             # Split alternatives on /
-            raw_alts = raw_word_field.split("/")
             words = []
             seen_in_entry = set()
-            for raw in raw_alts:
-                word = re.sub(r"[^A-Z]", "", raw.strip().upper())
+            for raw in raw_word_field.split("/"):
+                word = normalize_word(raw)
                 if len(word) < 2:
                     continue
                 if word in seen_in_entry:
@@ -74,6 +142,68 @@ def load_prototype_wordlist(path):
             if not words:
                 continue
 
-            entries.append({"words": words, "hint": hint})
+            yield {"words": words, "hint": hint.strip()}
 
-    return entries
+
+def _warn_duplicate(word):
+    print(f"WARNING: duplicate word '{word}' skipped", file=sys.stderr)
+
+
+def _cache_path(path):
+    directory, name = os.path.split(path)
+    return os.path.join(directory, f".{name}.cache")
+
+
+def _read_cache(path, kind):
+    """Cached data for path, or None if missing or stale.
+
+    The cache file (.<name>.cache next to the input) records the input's
+    mtime and size; any difference, another kind or version, or an
+    unreadable file counts as a miss.
+    """
+    try:
+        stat = os.stat(path)
+        with open(_cache_path(path), encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get("key") != [_CACHE_VERSION, kind, stat.st_mtime_ns, stat.st_size]:
+        return None
+    return cached
+
+
+def _write_cache(path, stat, kind, data):
+    """Atomically write the cache for path; stat is taken before parsing, so
+    an input modified meanwhile leaves a cache that will read as stale.
+    Failures (e.g. a read-only directory) are ignored."""
+    cache_path = _cache_path(path)
+    tmp_path = f"{cache_path}.tmp"
+    data = dict(data, key=[_CACHE_VERSION, kind, stat.st_mtime_ns, stat.st_size])
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(data, separators=(",", ":")))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def load_manifest(path):
+    """Load batch jobs from a CSV manifest with a header row.
+
+    Columns: input, name, and optionally rows, cols, seed. Blank or missing
+    optional fields come back as None (caller defaults apply).
+    Returns list of {"input", "name", "rows", "cols", "seed"}.
+    """
+    jobs = []
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        for n, row in enumerate(csv.DictReader(f), start=2):
+            row = {k.strip(): (v or "").strip() for k, v in row.items() if k}
+            if not any(row.values()):
+                continue
+            if not row.get("input") or not row.get("name"):
+                raise ValueError(f"{path}:{n}: input and name are required")
+            job = {"input": row["input"], "name": row["name"]}
+            for key in ("rows", "cols", "seed"):
+                job[key] = int(row[key]) if row.get(key) else None
+            jobs.append(job)
+    return jobs
@@ -1,16 +1,63 @@
 import itertools
+import math
 import os
 import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 
+from src.clues import fill_grid
 from src.generator import generate_crossword
+from src.serialize import load_checkpoint, save_checkpoint
 
+# Upper bound on combinations per worker task
+_MAX_CHUNK = 32
 
-def run_prototype(proto_entries, rows, cols, max_attempts=50, seed=None):
+# Per-process result cache for pool workers (see _evaluate_chunk)
+_worker_cache = None
+
+
+def run_prototype(proto_entries, rows, cols, max_attempts=50, seed=None, prune=False,
+                  race=False, race_eta=3, race_min_attempts=10, workers=None,
+                  checkpoint_path=None, checkpoint_every=5.0, resume=False, cache_mb=None):
     """Evaluate all word combinations and return the highest-scoring crossword.
 
     proto_entries: list of {"words": [str, ...], "hint": str}
+    prune: branch-and-bound over the combination tree. A subtree is skipped
+    when an upper bound on its score (see _score_upper_bound) cannot beat the
+    best score so far; the chosen combination is the same as without pruning.
+    race: successive halving instead of a full budget per combination (see
+    _race_combinations); per-round statistics go in prototype["race_rounds"].
+    Candidates are generated without grid cells (see generate_crossword's
+    with_grid); only the returned puzzle has them.
+    workers: evaluate combinations on a pool of N processes. Each worker walks
+    its own slice of the product, and results are reported in combination
+    order, so the printed progress and the chosen combination match a serial
+    run with the same seed.
+    checkpoint_path: every checkpoint_every seconds, atomically record the
+    next combination index, counters and best puzzle there; the file is
+    removed when the run completes. resume=True continues from an existing
+    checkpoint written for the same inputs. Not available with race.
+    cache_mb: keep partial layouts shared by neighbouring combinations (see
+    generate_crossword's prefix_cache) in an LRU of about that many MB per
+    process; results are the same with or without it. Needs a seed; hit/miss
+    counts of its lookups go in prototype["cache"].
     Returns the best puzzle dict with an added "prototype" key.
     """
+    if prune and race:
+        raise ValueError("prune and race cannot be combined")
+    if prune and workers is not None:
+        raise ValueError("prune needs the serial best score; it cannot use workers")
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers}")
+    if race and checkpoint_path:
+        raise ValueError("race rounds cannot be checkpointed")
+    if race and race_eta < 2:
+        raise ValueError(f"race_eta must be >= 2, got {race_eta}")
+    if race and race_min_attempts < 1:
+        raise ValueError(f"race_min_attempts must be >= 1, got {race_min_attempts}")
+    if cache_mb is not None and seed is None:
+        raise ValueError("cache_mb needs a fixed seed")
     alternatives = [e["words"] for e in proto_entries]
     hints = [e["hint"] for e in proto_entries]
     total_combos = 1
@@ -27,36 +74,111 @@ def run_prototype(proto_entries, rows, cols, max_attempts=50, seed=None):
     best_combo = None
     evaluated = 0
     skipped = 0
+    prune_stats = {"pruned": 0}
+    first_index = 0
+    prior_ms = 0.0
     start = time.perf_counter()
 
-    for i, combo in enumerate(itertools.product(*alternatives)):
-        # Skip combinations with duplicate words
-        if len(set(combo)) < len(combo):
-            skipped += 1
-            continue
+    fingerprint = {
+        "alternatives": alternatives,
+        "hints": hints,
+        "rows": rows,
+        "cols": cols,
+        "max_attempts": max_attempts,
+        "seed": seed,
+        "prune": prune,
+    }
+    if resume and checkpoint_path and os.path.exists(checkpoint_path):
+        ckpt = load_checkpoint(checkpoint_path)
+        if ckpt["fingerprint"] != fingerprint:
+            raise ValueError(f"checkpoint {checkpoint_path} was written for different inputs")
+        first_index = ckpt["next_index"]
+        evaluated = ckpt["evaluated"]
+        skipped = ckpt["skipped"]
+        prune_stats["pruned"] = ckpt["pruned"]
+        best_score = ckpt["best_score"]
+        best_combo_index = ckpt["best_combo_index"]
+        best_combo = tuple(ckpt["best_combo"]) if ckpt["best_combo"] is not None else None
+        best_puzzle = ckpt["best_puzzle"]
+        prior_ms = ckpt["elapsed_ms"]
+        print(f"Resuming at combination {first_index + 1}/{total_combos}"
+              f" (best so far: #{best_combo_index + 1}, score={best_score:.4f})")
+        print()
 
-        entries = [{"word": w, "hint": h} for w, h in zip(combo, hints)]
-        puzzle = generate_crossword(entries, rows, cols, seed=seed, max_attempts=max_attempts)
-        score = puzzle["metadata"]["score"]
-        placed = puzzle["metadata"]["placed"]
-        total = puzzle["metadata"]["total"]
-        evaluated += 1
+    def write_checkpoint(next_index):
+        save_checkpoint({
+            "fingerprint": fingerprint,
+            "next_index": next_index,
+            "evaluated": evaluated,
+            "skipped": skipped,
+            "pruned": prune_stats["pruned"],
+            "best_score": best_score,
+            "best_combo_index": best_combo_index,
+            "best_combo": best_combo,
+            "best_puzzle": best_puzzle,
+            "elapsed_ms": prior_ms + (time.perf_counter() - start) * 1000,
+        }, checkpoint_path)
+
+    last_checkpoint = time.perf_counter()
+
+    pool = ProcessPoolExecutor(max_workers=workers) if workers and workers > 1 else None
+    cache = _ResultCache(int(cache_mb * 2**20), _state_size) if cache_mb is not None else None
+
+    try:
+        rounds = None
+        if race:
+            results = ()  # racing evaluates combinations itself
+            raced = _race_combinations(
+                alternatives, hints, rows, cols, max_attempts, seed, race_eta, race_min_attempts,
+                total_combos, pool, workers, cache,
+            )
+            best_puzzle, best_combo_index, best_combo, evaluated, skipped, rounds = raced
+        elif prune:
+            combos = _pruned_product(alternatives, rows, cols, lambda: best_score, prune_stats,
+                                     first_index)
+            results = _evaluate_combos(combos, hints, rows, cols, max_attempts, seed, cache)
+        elif pool is None:
+            combos = _product_slice(alternatives, first_index, total_combos - first_index)
+            results = _evaluate_combos(combos, hints, rows, cols, max_attempts, seed, cache)
+        else:
+            results = _evaluate_parallel(pool, workers, alternatives, hints, rows, cols,
+                                         max_attempts, seed, total_combos, first_index, cache)
 
-        # Build variant summary (only multi-option entries)
-        variant_words = [combo[j] for j, alts in enumerate(alternatives) if len(alts) > 1]
-        variant_str = ", ".join(variant_words)
+        for i, combo, puzzle in results:
+            # Everything before i is done, so a checkpoint here resumes at i
+            if checkpoint_path and time.perf_counter() - last_checkpoint >= checkpoint_every:
+                write_checkpoint(i)
+                last_checkpoint = time.perf_counter()
 
-        is_best = score > best_score
-        marker = " *new best*" if is_best else ""
-        print(f"[{i + 1}/{total_combos}]  score={score:.4f}  placed={placed}/{total}  ({variant_str}){marker}")
+            # Skip combinations with duplicate words
+            if puzzle is None:
+                skipped += 1
+                continue
 
-        if is_best:
-            best_puzzle = puzzle
-            best_score = score
-            best_combo_index = i
-            best_combo = combo
+            score = puzzle["metadata"]["score"]
+            placed = puzzle["metadata"]["placed"]
+            total = puzzle["metadata"]["total"]
+            evaluated += 1
 
-    elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+            # Build variant summary (only multi-option entries)
+            variant_words = [combo[j] for j, alts in enumerate(alternatives) if len(alts) > 1]
+            variant_str = ", ".join(variant_words)
+
+            is_best = score > best_score
+            marker = " *new best*" if is_best else ""
+            print(f"[{i + 1}/{total_combos}]  score={score:.4f}  placed={placed}/{total}  ({variant_str}){marker}")
+
+            if is_best:
+                best_puzzle = puzzle
+                best_score = score
+                best_combo_index = i
+                best_combo = combo
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+    if checkpoint_path and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    elapsed_ms = round(prior_ms + (time.perf_counter() - start) * 1000, 1)
 
     # Attach prototype metadata
     selected_words = []
@@ -67,18 +189,421 @@ def run_prototype(proto_entries, rows, cols, max_attempts=50, seed=None):
             "hint": entry["hint"],
         })
 
+    # Candidates are generated without grid cells; only the winner needs them
+    fill_grid(best_puzzle)
     best_puzzle["prototype"] = {
         "total_combinations": total_combos,
         "evaluated": evaluated,
         "skipped_duplicates": skipped,
+        "pruned": prune_stats["pruned"],
         "best_combo_index": best_combo_index,
         "selected_words": selected_words,
         "total_runtime_ms": elapsed_ms,
     }
+    if rounds is not None:
+        best_puzzle["prototype"]["race_rounds"] = rounds
+    if cache is not None:
+        best_puzzle["prototype"]["cache"] = {"hits": cache.hits, "misses": cache.misses}
 
     return best_puzzle
 
 
+def _evaluate_combos(combos, hints, rows, cols, max_attempts, seed, cache=None):
+    """Yield (index, combo, puzzle) for each (index, combo); puzzle is None
+    for combinations with duplicate words. cache (a _ResultCache) is passed
+    to generate_crossword as its prefix_cache."""
+    for i, combo in combos:
+        if len(set(combo)) < len(combo):
+            yield i, combo, None
+            continue
+        entries = [{"word": w, "hint": h} for w, h in zip(combo, hints)]
+        puzzle = generate_crossword(entries, rows, cols, seed=seed, max_attempts=max_attempts,
+                                    with_grid=False, prefix_cache=cache)
+        yield i, combo, puzzle
+
+
+class _ResultCache:
+    """LRU map from key to value, evicted oldest-first once the values'
+    sizes (sizeof(value) bytes) pass max_bytes.
+
+    Here values are partial layouts (see generate_crossword's prefix_cache);
+    src.service keeps encoded responses and word lists in it too. Cached
+    values are shared, so callers copy before changing them.
+    """
+
+    def __init__(self, max_bytes, sizeof):
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def items(self):
+        """(key, value) pairs, oldest first; not counted as hits."""
+        return [(key, item[0]) for key, item in self._entries.items()]
+
+    def get(self, key):
+        item = self._entries.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return item[0]
+
+    def put(self, key, value):
+        size = self.sizeof(value)
+        if key in self._entries or size > self.max_bytes:
+            return
+        self._entries[key] = (value, size)
+        self.size += size
+        while self.size > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.size -= evicted
+
+
+def _state_size(state):
+    """Rough in-memory size of a list-backend attempt state, in bytes."""
+    grid = state["grid"]
+    # Grid rows are lists of shared one-letter strings; each filled cell also
+    # has an index tuple, and placement dicts are shared between copies
+    return (1024 + len(grid) * (64 + 8 * len(grid[0])) + 80 * state["filled"]
+            + 8 * len(state["placed"]))
+
+
+def _evaluate_chunk(combos, hints, rows, cols, max_attempts, seed, cache_bytes=None):
+    """Worker task: evaluate combos, keeping full puzzles only where needed.
+
+    Only a combination that beats every earlier one in the chunk can be the
+    overall best, so the rest come back as {"metadata": ...} to keep results
+    small. combos is a list of (index, combo) or an (alternatives, first,
+    count) slice of the product. With cache_bytes, a cache that lives as
+    long as the worker process is used.
+
+    Returns (results, cache hits, cache misses) for this chunk.
+    """
+    global _worker_cache
+    if isinstance(combos, tuple):
+        combos = _product_slice(*combos)
+    cache = None
+    if cache_bytes is not None:
+        if _worker_cache is None or _worker_cache.max_bytes != cache_bytes:
+            _worker_cache = _ResultCache(cache_bytes, _state_size)
+        cache = _worker_cache
+        hits, misses = cache.hits, cache.misses
+    results = []
+    chunk_best = -1
+    for i, combo, puzzle in _evaluate_combos(combos, hints, rows, cols, max_attempts, seed,
+                                             cache):
+        if puzzle is not None:
+            score = puzzle["metadata"]["score"]
+            if score > chunk_best:
+                chunk_best = score
+            else:
+                puzzle = {"metadata": puzzle["metadata"]}
+        results.append((i, combo, puzzle))
+    if cache is None:
+        return results, 0, 0
+    return results, cache.hits - hits, cache.misses - misses
+
+
+def _product_slice(alternatives, first, count):
+    """Yield (index, combo) for itertools.product indices [first, first + count).
+
+    Starts by decoding first as a mixed-radix number, then steps like an
+    odometer, so no earlier combinations are generated.
+    """
+    digits = []
+    rest = first
+    for alts in reversed(alternatives):
+        rest, digit = divmod(rest, len(alts))
+        digits.append(digit)
+    digits.reverse()
+
+    for i in range(first, first + count):
+        yield i, tuple(alts[d] for alts, d in zip(alternatives, digits))
+        for j in range(len(digits) - 1, -1, -1):
+            digits[j] += 1
+            if digits[j] < len(alternatives[j]):
+                break
+            digits[j] = 0
+
+
+def _stream_tasks(pool, workers, tasks):
+    """Submit (fn, args) tasks with a bounded window; yield results in order."""
+    window = []
+    tasks = iter(tasks)
+    for fn, args in tasks:
+        window.append(pool.submit(fn, *args))
+        if len(window) >= workers * 2:
+            break
+    while window:
+        result = window.pop(0).result()
+        for fn, args in tasks:
+            window.append(pool.submit(fn, *args))
+            break
+        yield result
+
+
+def _evaluate_parallel(pool, workers, alternatives, hints, rows, cols, max_attempts, seed,
+                       total_combos, first_index=0, cache=None):
+    """Yield (index, combo, puzzle) in order from first_index, evaluated by pool workers.
+
+    With a cache, each worker keeps its own of the same size, and their hit
+    and miss counts are added to cache's.
+    """
+    chunk = max(1, min(_MAX_CHUNK, (total_combos - first_index) // (workers * 4)))
+    cache_bytes = cache.max_bytes if cache is not None else None
+    tasks = (
+        (_evaluate_chunk, ((alternatives, first, min(chunk, total_combos - first)),
+                           hints, rows, cols, max_attempts, seed, cache_bytes))
+        for first in range(first_index, total_combos, chunk)
+    )
+    yield from _collect_chunks(_stream_tasks(pool, workers, tasks), cache)
+
+
+def _collect_chunks(chunks, cache):
+    """Flatten _evaluate_chunk results, adding worker cache counts to cache."""
+    for results, hits, misses in chunks:
+        if cache is not None:
+            cache.hits += hits
+            cache.misses += misses
+        yield from results
+
+
+def _race_combinations(alternatives, hints, rows, cols, max_attempts, seed, eta, min_attempts,
+                       total_combos, executor=None, workers=None, cache=None):
+    """Successive halving: race every combination on a small budget.
+
+    Each round scores the surviving combinations with the same seed and keeps
+    the top 1/eta (ties go to the earlier combination), then multiplies the
+    budget by eta. The first budget is an even share of max_attempts per
+    round, max_attempts // rounds, and at least min_attempts, because a few
+    attempts say little about a combination. The round that reaches max_attempts
+    (or has a single survivor) runs at the full budget and picks the winner.
+    With one shared seed a short run is a prefix of a longer one, so a
+    combination's score only grows with its budget.
+
+    Returns (puzzle, index, combo, evaluated, skipped, rounds).
+    """
+    survivors = []
+    skipped = 0
+    for i, combo in enumerate(itertools.product(*alternatives)):
+        if len(set(combo)) < len(combo):
+            skipped += 1
+            continue
+        survivors.append((i, combo))
+    evaluated = len(survivors)
+
+    n_rounds = 0
+    remaining = len(survivors)
+    while remaining > 1:
+        remaining = math.ceil(remaining / eta)
+        n_rounds += 1
+    budget = min(max_attempts, max(min_attempts, max_attempts // max(1, n_rounds)))
+
+    rounds = []
+    while True:
+        if len(survivors) == 1:
+            budget = max_attempts
+        final = budget == max_attempts
+        round_start = time.perf_counter()
+        scored = []
+        puzzles = {}
+        if executor is None:
+            results = _evaluate_combos(survivors, hints, rows, cols, budget, seed, cache)
+        else:
+            chunk = max(1, min(_MAX_CHUNK, len(survivors) // (workers * 4)))
+            cache_bytes = cache.max_bytes if cache is not None else None
+            tasks = (
+                (_evaluate_chunk, (survivors[k:k + chunk], hints, rows, cols, budget, seed,
+                                   cache_bytes))
+                for k in range(0, len(survivors), chunk)
+            )
+            results = _collect_chunks(_stream_tasks(executor, workers, tasks), cache)
+        for i, combo, puzzle in results:
+            puzzles[i] = puzzle
+            scored.append((puzzle["metadata"]["score"], i, combo))
+        scored.sort(key=lambda x: (-x[0], x[1]))
+        keep = 1 if final else math.ceil(len(survivors) / eta)
+        # Back to combination order, which _evaluate_chunk's compaction relies on
+        survivors = sorted((i, combo) for _, i, combo in scored[:keep])
+
+        top_score, top_index, _ = scored[0]
+        rounds.append({
+            "round": len(rounds) + 1,
+            "candidates": len(scored),
+            "attempts": budget,
+            "kept": keep,
+            "best_score": top_score,
+            "best_combo_index": top_index,
+            "runtime_ms": round((time.perf_counter() - round_start) * 1000, 1),
+        })
+        print(f"Round {len(rounds)}: {len(scored)} combinations x {budget} attempts"
+              f" -> kept {keep}  (best score={top_score:.4f} at #{top_index + 1})")
+        if final:
+            break
+        budget = min(max_attempts, budget * eta)
+
+    best_index, best_combo = survivors[0]
+    return puzzles[best_index], best_index, best_combo, evaluated, skipped, rounds
+
+
+def _pruned_product(alternatives, rows, cols, get_best_score, stats, first_index=0):
+    """Yield (index, combo) in itertools.product order, skipping bounded subtrees.
+
+    Before descending into a partial assignment, its score upper bound is
+    compared with get_best_score(); subtrees that cannot strictly beat it are
+    counted in stats["pruned"] and never generated. Combinations before
+    first_index (already handled by a resumed run) are neither yielded nor
+    counted.
+    """
+    n = len(alternatives)
+    # stride[j]: number of combinations under one choice at depth j
+    stride = [1] * n
+    for j in range(n - 2, -1, -1):
+        stride[j] = stride[j + 1] * len(alternatives[j + 1])
+    chosen = []
+
+    def descend(j, index):
+        if j == n:
+            if index >= first_index:
+                yield index, tuple(chosen)
+            return
+        for k, word in enumerate(alternatives[j]):
+            sub_first = index + k * stride[j]
+            sub_end = sub_first + stride[j]
+            if sub_end <= first_index:
+                continue
+            chosen.append(word)
+            bound = _score_upper_bound(chosen, alternatives[j + 1:], rows, cols)
+            # Scores are compared after rounding to 4 places, as in metadata
+            if round(bound, 4) <= get_best_score():
+                stats["pruned"] += sub_end - max(sub_first, first_index)
+            else:
+                yield from descend(j + 1, sub_first)
+            chosen.pop()
+
+    yield from descend(0, 0)
+
+
+def _score_upper_bound(words, open_alternatives, rows, cols):
+    """Upper bound on the generator's puzzle score for a (partial) combination.
+
+    Every placed word after the anchor crosses an earlier one, so a layout
+    only ever uses words from one group connected by shared letters, and only
+    words that fit the grid (len <= max(rows, cols)). Each crossing uses one
+    position in each of two words whose letter appears elsewhere in the
+    group, so crossings / letters is at most max(overlapping positions /
+    length) / 2 (the density). The score terms are then bounded per number
+    of placed words by _group_bound.
+    While entries are unassigned, all fitting words count as one group, each
+    open entry adds its longest fitting alternative, and density is 0.5.
+    """
+    limit = max(rows, cols)
+    area = rows * cols
+    total = len(words) + len(open_alternatives)
+    if total == 0 or area == 0:
+        return 0.0
+
+    fitting = [w for w in words if len(w) <= limit]
+    if open_alternatives:
+        open_lengths = []
+        for alts in open_alternatives:
+            lengths = [len(w) for w in alts if len(w) <= limit]
+            if lengths:
+                open_lengths.append(max(lengths))
+        return _group_bound([len(w) for w in fitting] + open_lengths, 0.5, total, area)
+
+    best = 0.0
+    for group in _sharing_groups(fitting):
+        density = 0.0
+        for i, w in enumerate(group):
+            others = set()
+            for j, o in enumerate(group):
+                if j != i:
+                    others |= _letter_set(o)
+            overlap = sum(n for ch, n in _letter_counts(w) if ch in others)
+            density = max(density, overlap / (2 * len(w)))
+        best = max(best, _group_bound([len(w) for w in group], density, total, area))
+    return best
+
+
+def _group_bound(lengths, density, total, area):
+    """Bound on the score of placing any k of these words, maximised over k.
+
+    k words have at most the k longest lengths' letters, and c crossings
+    with k - 1 <= c <= density * letters. Intersection density c / letters
+    and fill (letters - c, capped by area) share c, so they are bounded
+    together: the two terms are concave in c, so their maximum is at an
+    end of that range or where the fill reaches the area.
+    """
+    best = 0.0
+    letters = 0
+    for k, length in enumerate(sorted(lengths, reverse=True), 1):
+        letters += length
+        low = (k - 1) / letters
+        if low > density:
+            continue
+        ratios = [low, density]
+        full = 1 - area / letters
+        if low < full < density:
+            ratios.append(full)
+        terms = max(0.30 * r + 0.20 * min(area, letters * (1 - r)) / area for r in ratios)
+        best = max(best, 0.50 * k / total + terms)
+    return best
+
+
+def _sharing_groups(words):
+    """Partition words into groups connected through shared letters."""
+    parent = list(range(len(words)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i in range(len(words)):
+        for j in range(i + 1, len(words)):
+            if _shares_letter(words[i], words[j]):
+                parent[find(i)] = find(j)
+
+    groups = {}
+    for i, w in enumerate(words):
+        groups.setdefault(find(i), []).append(w)
+    return list(groups.values())
+
+
+# Per-word tables shared by every combination's bound. Alternatives repeat
+# across combinations, so these are computed once per word (or word pair).
+
+@lru_cache(maxsize=None)
+def _letter_set(word):
+    return frozenset(word)
+
+
+@lru_cache(maxsize=None)
+def _letter_counts(word):
+    """Letter histogram of word as ((letter, count), ...)."""
+    counts = {}
+    for ch in word:
+        counts[ch] = counts.get(ch, 0) + 1
+    return tuple(counts.items())
+
+
+@lru_cache(maxsize=None)
+def _shares_letter(a, b):
+    return not _letter_set(a).isdisjoint(_letter_set(b))
+
+
 def print_prototype_summary(result):
     """Print a human-readable summary of the prototype results."""
     proto = result["prototype"]
@@ -105,7 +630,13 @@ def print_prototype_summary(result):
         print()
 
     print(f"Evaluated: {proto['evaluated']}/{proto['total_combinations']} combinations"
-          f" ({proto['skipped_duplicates']} skipped for duplicates)")
+          f" ({proto['skipped_duplicates']} skipped for duplicates,"
+          f" {proto.get('pruned', 0)} pruned by score bound)")
+    for rnd in proto.get("race_rounds", []):
+        print(f"  Round {rnd['round']}: {rnd['candidates']} x {rnd['attempts']} attempts"
+              f" -> {rnd['kept']} kept, best {rnd['best_score']:.4f}, {rnd['runtime_ms'] / 1000:.1f}s")
+    if "cache" in proto:
+        print(f"Result cache: {proto['cache']['hits']} hits, {proto['cache']['misses']} misses")
     print(f"Total time: {proto['total_runtime_ms'] / 1000:.1f}s")
 
 
@@ -1,15 +1,199 @@
 import json
+import mmap
 import os
+import struct
 
+# Puzzle archives: a JSON-lines data file (header line, then one compact
+# puzzle per line with grid rows packed into strings) plus a <path>.idx
+# sidecar of little-endian uint64 line offsets, one per puzzle.
+ARCHIVE_HEADER = {"format": "crossword-archive", "version": 1}
+_OFFSET = struct.Struct("<Q")
 
-def save_puzzle(puzzle, out_path):
-    """Save puzzle dict to JSON file, creating directories as needed."""
+
+def save_puzzle(puzzle, out_path, compact=False):
+    """Save puzzle dict to JSON file, creating directories as needed.
+
+    compact=True writes it on one line without spaces.
+    """
     os.makedirs(os.path.dirname(out_path), exist_ok=True)
     with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(puzzle, f, indent=2)
+        if compact:
+            json.dump(puzzle, f, separators=(",", ":"))
+        else:
+            json.dump(puzzle, f, indent=2)
+
+
+def load_puzzle(path, index=None):
+    """Load puzzle dict from JSON file, or puzzle number index of an archive.
+
+    Archive reads look up one offset in the index and parse one line, so
+    they cost the same for any index and archive size.
+    """
+    if index is None:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    if index < 0:
+        raise IndexError(f"archive index out of range: {index}")
+    with open(_index_path(path), "rb") as f:
+        f.seek(index * _OFFSET.size)
+        entry = f.read(_OFFSET.size)
+    if len(entry) < _OFFSET.size:
+        raise IndexError(f"archive index out of range: {index}")
+    with open(path, "rb") as f:
+        f.seek(_OFFSET.unpack(entry)[0])
+        return unpack_puzzle(json.loads(f.readline()))
+
+
+def save_archive(puzzles, path):
+    """Write puzzles to a new archive at path, replacing any existing one."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(_json_line(ARCHIVE_HEADER))
+    with open(_index_path(path), "wb"):
+        pass
+    return append_puzzles(puzzles, path)
+
+
+def append_puzzles(puzzles, path):
+    """Append puzzles to the archive at path (created if missing).
+
+    Each data line is written before its index entry, so an interrupted
+    append leaves at most one unindexed trailing line, which later appends
+    and reads ignore. Returns the number of puzzles in the archive.
+    """
+    if not os.path.exists(path):
+        return save_archive(puzzles, path)
+    with open(path, "rb") as f:
+        f.seek(-1, os.SEEK_END)
+        torn = f.read(1) != b"\n"
+    with open(path, "ab") as data, open(_index_path(path), "ab") as idx:
+        if torn:
+            data.write(b"\n")  # end a line cut short by an interrupted append
+        for puzzle in puzzles:
+            offset = data.tell()
+            data.write(_json_line(pack_puzzle(puzzle)))
+            data.flush()
+            idx.write(_OFFSET.pack(offset))
+        return idx.tell() // _OFFSET.size
+
+
+def archive_len(path):
+    """Number of puzzles in the archive at path."""
+    return os.path.getsize(_index_path(path)) // _OFFSET.size
+
+
+def rebuild_archive_index(path):
+    """Recreate <path>.idx by scanning the data file; returns the puzzle count.
+
+    Lines that do not parse (cut short by an interrupted append) are skipped.
+    """
+    offsets = []
+    with open(path, "rb") as f:
+        if json.loads(f.readline()) != ARCHIVE_HEADER:
+            raise ValueError(f"{path} is not a crossword archive")
+        offset = f.tell()
+        for line in f:
+            try:
+                json.loads(line)
+            except ValueError:
+                pass  # torn line from an interrupted append
+            else:
+                offsets.append(offset)
+            offset += len(line)
+    with open(_index_path(path), "wb") as f:
+        f.write(b"".join(_OFFSET.pack(o) for o in offsets))
+    return len(offsets)
+
+
+class ArchiveReader:
+    """Read-only sequence view of an archive backed by mmap.
+
+    Opening maps the data and index files without reading them, so it takes
+    the same time and memory for any archive size; reader[i] decodes only
+    puzzle i. Puzzles appended after opening are not visible.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            if json.loads(f.readline()) != ARCHIVE_HEADER:
+                raise ValueError(f"{path} is not a crossword archive")
+        self._data = _map_file(path)
+        self._index = _map_file(_index_path(path))
+        self._len = len(self._index) // _OFFSET.size if self._index is not None else 0
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError(f"archive index out of range: {i}")
+        start = _OFFSET.unpack_from(self._index, i * _OFFSET.size)[0]
+        end = self._data.find(b"\n", start)
+        return unpack_puzzle(json.loads(self._data[start:end]))
+
+    def close(self):
+        for m in (self._data, self._index):
+            if m is not None:
+                m.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _map_file(path):
+    """Read-only mmap of path, or None when it is empty (mmap rejects size 0)."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def pack_puzzle(puzzle):
+    """Copy of puzzle with grid cells as one string per row."""
+    grid = dict(puzzle["grid"])
+    grid["cells"] = ["".join(row) for row in grid["cells"]]
+    return dict(puzzle, grid=grid)
+
+
+def unpack_puzzle(packed):
+    """Inverse of pack_puzzle (modifies packed in place)."""
+    packed["grid"]["cells"] = [list(row) for row in packed["grid"]["cells"]]
+    return packed
+
+
+def _index_path(path):
+    return f"{path}.idx"
+
+
+def _json_line(obj):
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def save_checkpoint(state, path):
+    """Atomically replace path with state as compact JSON.
+
+    Written to a temp file in the same directory, then os.replace'd, so a
+    run killed mid-write leaves the previous checkpoint intact.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, separators=(",", ":"))
+    os.replace(tmp_path, path)
 
 
-def load_puzzle(path):
-    """Load puzzle dict from JSON file."""
+def load_checkpoint(path):
+    """Load a checkpoint written by save_checkpoint."""
     with open(path, encoding="utf-8") as f:
         return json.load(f)
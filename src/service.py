@@ -0,0 +1,334 @@
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from src.clues import number_clues
+from src.generator import generate_crossword
+from src.io import parse_wordlist
+from src.prototype import _ResultCache
+
+# generate_crossword options a request may set, with their types
+_OPTIONS = {
+    "strategy": str,
+    "beam_width": int,
+    "backend": str,
+    "time_budget_ms": (int, float),
+    "patience": int,
+    "target_score": (int, float),
+}
+
+# Word lists registered before start(), keyed by id; set once per pool
+# worker by _init_worker. Uploaded lists travel with each task instead.
+_worker_wordlists = {}
+
+
+class ServiceBusy(Exception):
+    """Every worker is busy and the queue is full; retry later."""
+
+
+class RequestError(ValueError):
+    """A request the service cannot run (bad field, unknown word list)."""
+
+    def __init__(self, message, status=HTTPStatus.BAD_REQUEST):
+        super().__init__(message)
+        self.status = status
+
+
+class GenerationService:
+    """Word lists, a warm process pool and a response cache behind one lock.
+
+    Word lists are identified by a hash of their parsed entries, so the same
+    content always gets the same id. Lists registered before start() are
+    kept for good and handed to every worker once; lists uploaded later are
+    kept in an LRU (wordlist_mb) and travel with each task that uses them.
+    A list has one name; registering it under another renames it.
+
+    At most workers + queue_limit generations are pending at a time; past
+    that, generate() raises ServiceBusy. Requests are capped (max_size,
+    max_attempts, max_beam_width) and every generation runs under a time
+    budget of at most max_time_budget_ms, so none can hold a worker for long.
+
+    Seeded runs that finish before their time budget are deterministic, so
+    their encoded responses are cached (LRU, cache_mb) under the word list
+    id, grid size, seed, attempts and options, and identical requests that
+    arrive while one is running wait for it instead of queueing their own.
+    """
+
+    def __init__(self, workers=None, queue_limit=16, cache_mb=64, max_size=50,
+                 max_attempts=1000, max_time_budget_ms=10000, max_beam_width=64,
+                 wordlist_mb=64):
+        self.workers = workers or os.cpu_count() or 1
+        self.queue_limit = queue_limit
+        self.max_size = max_size
+        self.max_attempts = max_attempts
+        self.max_time_budget_ms = max_time_budget_ms
+        self.max_beam_width = max_beam_width
+        self.cache = _ResultCache(int(cache_mb * 2**20), sizeof=len)
+        self._lock = threading.Lock()
+        self._preloaded = {}
+        self._uploads = _ResultCache(int(wordlist_mb * 2**20), sizeof=_wordlist_size)
+        self._names = {}
+        self._pending = 0
+        self._inflight = {}
+        self._pool = None
+
+    def register(self, entries, name=None):
+        """Add a word list; returns its summary {"id", "name", "words"}."""
+        if not entries:
+            raise RequestError("word list has no usable entries")
+        list_id = wordlist_id(entries)
+        with self._lock:
+            if self._pool is None:
+                self._preloaded[list_id] = entries
+            elif list_id not in self._preloaded and self._uploads.get(list_id) is None:
+                self._uploads.put(list_id, entries)
+                if list_id not in self._uploads:
+                    raise RequestError("word list is larger than the word list cache",
+                                       HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+            # Drop names of evicted lists and this list's old name
+            self._names = {
+                other: other_id for other, other_id in self._names.items()
+                if (other_id in self._preloaded or other_id in self._uploads)
+                and not (name and other_id == list_id)
+            }
+            if name:
+                self._names[name] = list_id
+        return {"id": list_id, "name": name, "words": len(entries)}
+
+    def wordlists(self):
+        with self._lock:
+            names = {list_id: name for name, list_id in self._names.items()}
+            lists = list(self._preloaded.items()) + self._uploads.items()
+            return [{"id": list_id, "name": names.get(list_id), "words": len(entries)}
+                    for list_id, entries in lists]
+
+    def start(self):
+        self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                         initargs=(self._preloaded,))
+        # Fork the workers now rather than on the first request
+        for future in [self._pool.submit(os.getpid) for _ in range(self.workers)]:
+            future.result()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def status(self):
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "pending": self._pending,
+                "queue_limit": self.queue_limit,
+                "wordlists": len(self._preloaded) + len(self._uploads),
+                "cache": {"entries": len(self.cache), "bytes": self.cache.size,
+                          "hits": self.cache.hits, "misses": self.cache.misses},
+            }
+
+    def generate(self, request):
+        """Run one /generate request; returns (JSON bytes, cache hit?).
+
+        request: {"wordlist": id or name, "rows", "cols", "seed", "attempts",
+        plus any of _OPTIONS}. The response is the puzzle with numbered clues.
+        """
+        list_id, entries, rows, cols, seed, attempts, options = self._parse(request)
+        key = None
+        if seed is not None:
+            key = (list_id, rows, cols, seed, attempts, tuple(sorted(options.items())))
+
+        with self._lock:
+            shared = None
+            if key is not None:
+                body = self.cache.get(key)
+                if body is not None:
+                    return body, True
+                shared = self._inflight.get(key)
+            if shared is None:
+                future = self._submit(key, list_id, entries, rows, cols, seed, attempts,
+                                      options)
+        if shared is not None:
+            return shared.result()[0], True
+
+        body = stop_reason = None
+        try:
+            body, stop_reason = future.result()
+        finally:
+            with self._lock:
+                self._pending -= 1
+                if key is not None:
+                    self._inflight.pop(key, None)
+                    # A run cut short by its deadline depends on machine load
+                    if body is not None and stop_reason != "time_budget":
+                        self.cache.put(key, body)
+        return body, False
+
+    def _submit(self, key, list_id, entries, rows, cols, seed, attempts, options):
+        """Queue a generation; the caller holds the lock."""
+        if self._pending >= self.workers + self.queue_limit:
+            raise ServiceBusy(f"{self._pending} generations pending")
+        if list_id in self._preloaded:
+            entries = None
+        self._pending += 1
+        future = self._pool.submit(_generate, list_id, entries, rows, cols, seed,
+                                   attempts, options)
+        if key is not None:
+            self._inflight[key] = future
+        return future
+
+    def _parse(self, request):
+        if not isinstance(request, dict):
+            raise RequestError("request body must be a JSON object")
+        ref = _field(request, "wordlist", str, None)
+        with self._lock:
+            list_id = self._names.get(ref, ref)
+            entries = self._preloaded.get(list_id) or self._uploads.get(list_id)
+        if entries is None:
+            raise RequestError(f"unknown word list {ref!r}", HTTPStatus.NOT_FOUND)
+        rows = _field(request, "rows", int, 15)
+        cols = _field(request, "cols", int, 15)
+        for name, size in (("rows", rows), ("cols", cols)):
+            if not 2 <= size <= self.max_size:
+                raise RequestError(f"{name} must be between 2 and {self.max_size}")
+        seed = _field(request, "seed", int, None)
+        attempts = _field(request, "attempts", int, 200)
+        if not 1 <= attempts <= self.max_attempts:
+            raise RequestError(f"attempts must be between 1 and {self.max_attempts}")
+        options = {}
+        for name, kind in _OPTIONS.items():
+            value = _field(request, name, kind, None)
+            if value is not None:
+                options[name] = value
+        if options.get("patience", 0) < 0:
+            raise RequestError("patience must be >= 0")
+        budget = options.get("time_budget_ms", self.max_time_budget_ms)
+        if budget <= 0:
+            raise RequestError("time_budget_ms must be > 0")
+        options["time_budget_ms"] = min(budget, self.max_time_budget_ms)
+        if options.get("beam_width", 1) > self.max_beam_width:
+            raise RequestError(f"beam_width must be <= {self.max_beam_width}")
+        return list_id, entries, rows, cols, seed, attempts, options
+
+
+def wordlist_id(entries):
+    """Short content hash of parsed word list entries."""
+    data = json.dumps(entries, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()[:16]
+
+
+def _wordlist_size(entries):
+    """Rough in-memory size of parsed word list entries, in bytes."""
+    return sum(200 + len(e["word"]) + len(e["hint"]) for e in entries)
+
+
+def _field(request, name, kind, default):
+    value = request.get(name)
+    if value is None:
+        return default
+    # bool is an int subclass; reject it for numeric fields
+    if isinstance(value, bool) or not isinstance(value, kind):
+        raise RequestError(f"{name} has the wrong type: {value!r}")
+    return value
+
+
+def _init_worker(wordlists):
+    _worker_wordlists.update(wordlists)
+
+
+def _generate(list_id, entries, rows, cols, seed, attempts, options):
+    """Worker task: generate, number clues and encode the response.
+
+    entries is None for lists the worker got from _init_worker. Returns
+    (JSON bytes, stop_reason).
+    """
+    if entries is None:
+        entries = _worker_wordlists[list_id]
+    puzzle = generate_crossword(entries, rows, cols, seed=seed, max_attempts=attempts,
+                                **options)
+    puzzle = number_clues(puzzle)
+    body = json.dumps(puzzle, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return body, puzzle["metadata"]["stop_reason"]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """JSON endpoints; see the README for the request and response shapes."""
+
+    service = None
+    max_body = 1024 * 1024
+    server_version = "crossword-serve"
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if path == "/health":
+            self._send_json(dict(self.service.status(), status="ok"))
+        elif path == "/wordlists":
+            self._send_json({"wordlists": self.service.wordlists()})
+        else:
+            self._send_error(HTTPStatus.NOT_FOUND, f"no such endpoint: {path}")
+
+    def do_POST(self):
+        path = urlsplit(self.path).path
+        try:
+            request = self._read_json()
+            if path == "/generate":
+                body, hit = self.service.generate(request)
+                self._send(HTTPStatus.OK, body, {"X-Cache": "hit" if hit else "miss"})
+            elif path == "/wordlists":
+                if not isinstance(request, dict) or not isinstance(request.get("csv"), str):
+                    raise RequestError('expected {"csv": "<word,hint lines>", "name": ...}')
+                name = _field(request, "name", str, None)
+                entries = parse_wordlist(request["csv"], on_duplicate=lambda word: None)
+                self._send_json(self.service.register(entries, name), HTTPStatus.CREATED)
+            else:
+                self._send_error(HTTPStatus.NOT_FOUND, f"no such endpoint: {path}")
+        except RequestError as e:
+            self._send_error(e.status, str(e))
+        except ServiceBusy as e:
+            self._send_error(HTTPStatus.SERVICE_UNAVAILABLE, str(e), {"Retry-After": "1"})
+        except ValueError as e:
+            # Rejected by generate_crossword (unknown strategy, backend, ...)
+            self._send_error(HTTPStatus.BAD_REQUEST, str(e))
+
+    def _read_json(self):
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            raise RequestError("Content-Length is not an integer")
+        if length < 0:
+            raise RequestError("Content-Length is negative")
+        if length > self.max_body:
+            raise RequestError(f"body larger than {self.max_body} bytes",
+                               HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+        try:
+            return json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            raise RequestError("body is not valid JSON")
+
+    def _send_json(self, data, status=HTTPStatus.OK):
+        self._send(status, json.dumps(data).encode("utf-8"))
+
+    def _send_error(self, status, message, headers=None):
+        self._send(status, json.dumps({"error": message}).encode("utf-8"), headers)
+
+    def _send(self, status, body, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def make_server(service, host="127.0.0.1", port=8000, max_body=1024 * 1024, quiet=False):
+    """HTTP server for a started service; call serve_forever() on it."""
+    handler = type("Handler", (_Handler,), {"service": service, "max_body": max_body})
+    if quiet:
+        handler.log_message = lambda self, *args: None
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
@@ -0,0 +1,149 @@
+import math
+import random
+
+from src.clues import fill_grid
+from src.generator import generate_crossword
+
+
+def auto_size(entries, seed=None, probe_attempts=20, square=False, aspect=None,
+              max_side=None, **generate_kwargs):
+    """Find the smallest grid on which a short seeded run places every word.
+
+    Each probe is generate_crossword(entries, rows, cols, seed,
+    probe_attempts, **generate_kwargs). Sizes are binary-searched between a
+    lower bound (the longest word must fit, and every cell holds at most two
+    words' letters, so area >= letters / 2) and an upper bound found by
+    doubling from it, capped at max_side (default: the total letter count,
+    enough for any chain of words). A probe that fits also narrows the next
+    one: the bounding box of its layout is the next size tried.
+
+    Shapes: square=True keeps rows == cols; aspect=A keeps cols ~= rows * A;
+    otherwise the smallest square is found first, then rows and cols are
+    shrunk one at a time.
+
+    Returns {"rows", "cols", "seed", "probes": [(rows, cols, placed_all), ...],
+    "puzzle": the fitting probe's puzzle at that size, without grid cells};
+    generate_fitted runs the final pass from it.
+    Raises ValueError when no grid up to max_side places every word.
+    """
+    if not entries:
+        raise ValueError("auto_size needs at least one word")
+    if square and aspect is not None:
+        raise ValueError("square and aspect are mutually exclusive")
+    if aspect is not None and aspect <= 0:
+        raise ValueError(f"aspect must be > 0, got {aspect}")
+    if seed is None:
+        seed = random.randint(0, 2**31 - 1)
+
+    longest = max(len(e["word"]) for e in entries)
+    letters = sum(len(e["word"]) for e in entries)
+    min_area = math.ceil(letters / 2)
+    if max_side is None:
+        max_side = letters
+    probes = []
+    # (rows, cols) -> probe puzzle placing every word there, or None
+    fitted = {}
+
+    def probe(rows, cols):
+        """Bounding box (height, width) of a layout placing every word, or None."""
+        if (rows, cols) not in fitted:
+            puzzle = generate_crossword(entries, rows, cols, seed=seed,
+                                        max_attempts=probe_attempts, with_grid=False,
+                                        **generate_kwargs)
+            if puzzle["metadata"]["placed"] < len(entries):
+                puzzle = None
+            fitted[(rows, cols)] = puzzle
+            probes.append((rows, cols, puzzle is not None))
+        puzzle = fitted[(rows, cols)]
+        return _bounding_box(puzzle["placed"]) if puzzle is not None else None
+
+    if aspect is not None:
+        def shape(n):
+            return n, max(1, round(n * aspect))
+    else:
+        def shape(n):
+            return n, n
+
+    lo = 1
+    while max(shape(lo)) < longest or _area(shape(lo)) < min_area:
+        lo += 1
+    hi = _upper_bound(lo, max_side, shape, probe)
+    if hi is None:
+        raise ValueError(f"no grid up to {max_side}x{max_side} placed every word "
+                         f"in {probe_attempts} attempts")
+    rows, cols = shape(_smallest(lo, hi, shape, probe))
+
+    if not square and aspect is None:
+        rows = _smallest(max(1, math.ceil(min_area / cols)), rows, lambda n: (n, cols), probe)
+        cols = _smallest(max(1, math.ceil(min_area / rows)), cols, lambda n: (rows, n), probe)
+    return {"rows": rows, "cols": cols, "seed": seed, "probes": probes,
+            "puzzle": fitted[(rows, cols)]}
+
+
+def generate_fitted(entries, size, max_attempts=200, **generate_kwargs):
+    """generate_crossword at an auto_size result's size and seed, placing every word.
+
+    The full run can still leave a word out: early stopping (patience,
+    time_budget_ms, target_score) may end it before it repeats the fitting
+    probe's attempts, or a partial layout may outscore it. Then the probe's
+    puzzle is returned instead, with its own metadata.
+    """
+    puzzle = generate_crossword(entries, size["rows"], size["cols"], seed=size["seed"],
+                                max_attempts=max_attempts, **generate_kwargs)
+    if puzzle["metadata"]["placed"] < len(entries):
+        puzzle = fill_grid(size["puzzle"])
+    return puzzle
+
+
+def _area(size):
+    return size[0] * size[1]
+
+
+def _bounding_box(placed):
+    height = width = 0
+    for p in placed:
+        length = len(p["word"])
+        across = p["direction"] == "across"
+        height = max(height, p["row"] + (1 if across else length))
+        width = max(width, p["col"] + (length if across else 1))
+    top = min(p["row"] for p in placed)
+    left = min(p["col"] for p in placed)
+    return height - top, width - left
+
+
+def _upper_bound(lo, max_side, shape, probe):
+    """First n of lo, 2*lo, 4*lo, ..., capped where shape(n) passes max_side,
+    whose shape fits; None if none does."""
+    cap = lo
+    while max(shape(cap + 1)) <= max_side:
+        cap += 1
+    if max(shape(lo)) > max_side:
+        return None
+    n = lo
+    while not probe(*shape(n)):
+        if n == cap:
+            return None
+        n = min(2 * n, cap)
+    return n
+
+
+def _smallest(lo, hi, shape, probe):
+    """Smallest n in [lo, hi] whose shape(n) fits; shape(hi) is known to fit.
+
+    Each new fit at hi is followed by a probe at the smallest n whose shape
+    still holds that layout's bounding box (a layout that size exists), then
+    by plain bisection.
+    """
+    hinted = None
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if hinted != hi:
+            hinted = hi
+            height, width = probe(*shape(hi))
+            mid = next((n for n in range(lo, hi)
+                        if shape(n)[0] >= height and shape(n)[1] >= width), mid)
+        if probe(*shape(mid)):
+            hi = mid
+        else:
+            lo = mid + 1
+    return hi
@@ -0,0 +1,14 @@
+from src.generator import generate_crossword
+from src.io import load_wordlist
+
+
+def test_backtrack_exhausts_at_once_when_a_word_cannot_fit():
+    # sample.csv has words longer than 8 letters, so no 8x8 layout places them all
+    entries = load_wordlist("input/sample.csv")
+    greedy = generate_crossword(entries, 8, 8, seed=1, max_attempts=10)
+    puzzle = generate_crossword(entries, 8, 8, seed=1, max_attempts=10, strategy="backtrack",
+                                time_budget_ms=2000)
+    meta = puzzle["metadata"]
+    assert meta["stop_reason"] == "exhausted"
+    assert meta["nodes"] == 0
+    assert meta["placed"] == greedy["metadata"]["placed"]
@@ -0,0 +1,18 @@
+import contextlib
+import io
+
+from benchmarks.synthetic import synthetic_prototype
+from src.prototype import run_prototype
+
+
+def test_prune_skips_oversized_combinations_and_keeps_the_winner():
+    # Most alternatives are longer than the 8x8 grid
+    entries = synthetic_prototype(12, 8, alternatives=2, seed=2, max_len=16)
+    results = []
+    for prune in (False, True):
+        with contextlib.redirect_stdout(io.StringIO()):
+            results.append(run_prototype(entries, 8, 8, max_attempts=5, seed=0, prune=prune))
+    full, pruned = results
+    assert pruned["prototype"]["pruned"] > 0
+    assert pruned["prototype"]["best_combo_index"] == full["prototype"]["best_combo_index"]
+    assert pruned["metadata"]["score"] == full["metadata"]["score"]
@@ -0,0 +1,13 @@
+from src.io import load_wordlist
+from src.sizing import auto_size, generate_fitted
+
+
+def test_fitted_run_places_every_word_despite_early_stopping():
+    # patience=2 stops the final run before it repeats the fitting probe's attempts
+    entries = load_wordlist("input/sample.csv")
+    for seed in (1, 2, 3, 5):
+        size = auto_size(entries, seed=seed)
+        puzzle = generate_fitted(entries, size, patience=2)
+        assert puzzle["metadata"]["placed"] == len(entries)
+        assert (puzzle["grid"]["rows"], puzzle["grid"]["cols"]) == (size["rows"], size["cols"])
+        assert "cells" in puzzle["grid"]